@@ -92,7 +92,7 @@ def copy_file_safe(
     # Handle macOS attributes on source
     if handle_attributes:
         try:
-            from utils.file_ops import prepare_for_copy, clear_destination_attributes
+            from utils.file_ops import prepare_for_copy
             result['source_attributes'] = prepare_for_copy(src)
         except ImportError:
             pass  # file_ops not available, continue without
@@ -104,17 +104,22 @@ def copy_file_safe(
         # Copy file with metadata
         shutil.copy2(src, dst)
 
-        # Clear attributes on destination (macOS)
-        if handle_attributes:
+        # Clear attributes on destination (macOS) and normalize permissions
+        # in a single pass
+        if handle_attributes or normalize:
             try:
-                from utils.file_ops import clear_destination_attributes
-                result['dest_attributes'] = clear_destination_attributes(dst)
+                from utils.file_ops import finalize_destination
+                dest_attributes = finalize_destination(
+                    dst, FILE_MODE, DIR_MODE,
+                    clear_attributes=handle_attributes,
+                    normalize=normalize,
+                )
+                if handle_attributes:
+                    result['dest_attributes'] = dest_attributes
             except ImportError:
-                pass
-
-        # Normalize permissions
-        if normalize:
-            normalize_permissions(dst)
+                # file_ops not available, normalize without it
+                if normalize:
+                    normalize_permissions(dst)
 
     except OSError as e:
         result['status'] = 'error'
@@ -179,17 +184,19 @@ def copy_directory_safe(
                 result['files_copied'] += len(files)
                 result['dirs_copied'] += len(dirs)
 
-        # Clear macOS attributes on destination
-        if handle_attributes:
+        # Clear macOS attributes on destination and normalize permissions
+        # (this handles the whole tree) in a single pass
+        if handle_attributes or normalize:
             try:
-                from utils.file_ops import clear_destination_attributes
-                clear_destination_attributes(dst)
+                from utils.file_ops import finalize_destination
+                finalize_destination(
+                    dst, FILE_MODE, DIR_MODE,
+                    clear_attributes=handle_attributes,
+                    normalize=normalize,
+                )
             except ImportError:
-                pass
-
-        # Normalize permissions (this handles the whole tree)
-        if normalize:
-            normalize_permissions(dst)
+                if normalize:
+                    normalize_permissions(dst)
 
         if result['errors']:
             result['status'] = 'partial'
@@ -32,6 +32,7 @@ From MACINVENTORY_IMPLEMENTATION_GUIDE.md:
 
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -83,39 +84,51 @@ def run_inventory(config: dict[str, Any]) -> dict[str, Any]:
     # =================================================================
     # Phase 1: Run All Scanners
     # =================================================================
-    print("Scanning applications...", flush=True)
     scan_results: dict[str, Any] = {}
 
+    # The package and version manager scanners spend nearly all their time
+    # waiting on brew/mas/npm/gem/etc. subprocesses, so start them up front
+    # and let them overlap with each other and with the application scan.
+    print("Starting package and version manager scans in the background...", flush=True)
+    executor = ThreadPoolExecutor(max_workers=4)
+    homebrew_future = executor.submit(homebrew.scan)
+    mas_future = executor.submit(homebrew.scan_mas)
+    version_managers_future = executor.submit(version_managers.scan)
+    global_packages_future = executor.submit(global_packages.scan)
+    executor.shutdown(wait=False)
+
+    print("Scanning applications...", flush=True)
+
     try:
         scan_results["applications"] = applications.scan()
     except Exception as e:
         scan_results["applications"] = {"applications": [], "count": 0, "errors": [str(e)]}
         results["errors"].append(f"Applications scan failed: {e}")
 
-    print("Scanning Homebrew packages...", flush=True)
+    print("Collecting Homebrew results...", flush=True)
     try:
-        scan_results["homebrew"] = homebrew.scan()
+        scan_results["homebrew"] = homebrew_future.result()
     except Exception as e:
         scan_results["homebrew"] = {"formulae": [], "casks": [], "taps": [], "errors": [str(e)]}
         results["errors"].append(f"Homebrew scan failed: {e}")
 
-    print("Scanning Mac App Store...", flush=True)
+    print("Collecting Mac App Store results...", flush=True)
     try:
-        scan_results["mas"] = homebrew.scan_mas()
+        scan_results["mas"] = mas_future.result()
     except Exception as e:
         scan_results["mas"] = {"apps": [], "errors": [str(e)]}
         results["errors"].append(f"MAS scan failed: {e}")
 
-    print("Scanning version managers...", flush=True)
+    print("Collecting version manager results...", flush=True)
     try:
-        scan_results["version_managers"] = version_managers.scan()
+        scan_results["version_managers"] = version_managers_future.result()
     except Exception as e:
         scan_results["version_managers"] = {}
         results["errors"].append(f"Version managers scan failed: {e}")
 
-    print("Scanning global packages...", flush=True)
+    print("Collecting global package results...", flush=True)
     try:
-        scan_results["global_packages"] = global_packages.scan()
+        scan_results["global_packages"] = global_packages_future.result()
     except Exception as e:
         scan_results["global_packages"] = {}
         results["errors"].append(f"Global packages scan failed: {e}")
@@ -3,44 +3,195 @@
 Scans for globally installed packages across various package managers.
 """
 
+import functools
+import os
+import re
+import shutil
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import json as json_lib
-from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
+# orjson is optional; it parses large npm/pip JSON several times faster than
+# the stdlib. Its JSONDecodeError subclasses json.JSONDecodeError, so error
+# handling is the same with either parser.
+try:
+    import orjson as _json_parser
+except ImportError:
+    _json_parser = json_lib
 
-def _run_command(cmd: list[str], timeout: int = 60) -> Optional[str]:
-    """Run a command and return its stdout, or None on failure.
+# ijson is optional; with it, JSON package listings are parsed incrementally
+# from the pipe instead of buffering the whole document first.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# One "name@version" entry of `npm list` tree output, e.g. "├── @org/pkg@1.2.3".
+# The greedy name splits on the last "@", so scoped package names stay whole;
+# lines starting with "/" are the install prefix header, not packages.
+_NPM_TREE_LINE = re.compile(r"^(?!/)(?:[├└]──\s*)?(?P<name>.+)@(?P<version>[^@]*)$")
+
+
+def _probe_command(
+    cmd: list[str], timeout: int = 60, binary: bool = False
+) -> tuple[bool, Optional[Union[str, bytes]]]:
+    """Run a command, reporting whether its executable exists and its stdout.
+
+    Running the real command directly doubles as the install check: a missing
+    executable raises FileNotFoundError, so no separate ``which`` is needed.
 
     Args:
         cmd: Command and arguments as a list
         timeout: Timeout in seconds
+        binary: Return stdout as raw bytes, skipping the text decode (for
+            output that goes straight to a JSON parser, which accepts bytes)
 
     Returns:
-        stdout as string, or None if command failed
+        Tuple of (found, stdout) - found is False only when the executable
+        is missing; stdout is None if the command failed
     """
     try:
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
+            text=not binary,
             timeout=timeout,
         )
-        if result.returncode == 0:
-            return result.stdout.strip()
-        return None
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-        return None
+    except FileNotFoundError:
+        return False, None
+    except (subprocess.TimeoutExpired, OSError):
+        return True, None
+
+    if result.returncode == 0:
+        return True, result.stdout.strip()
+    return True, None
+
+
+def _stream_json_command(
+    cmd: list[str], key: Optional[str] = None, timeout: int = 60
+) -> tuple[bool, Optional[list]]:
+    """Run a command and parse its JSON stdout incrementally with ijson.
+
+    Args:
+        cmd: Command and arguments as a list
+        key: Top-level object key to extract as (name, value) pairs; if
+            None, extract the elements of a top-level array
+        timeout: Timeout in seconds
+
+    Returns:
+        Tuple of (found, values) like _probe_command; values is None if
+        the command failed
+
+    Raises:
+        ValueError: If the command succeeded but printed invalid JSON
+    """
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except FileNotFoundError:
+        return False, None
+    except OSError:
+        return True, None
+
+    error = None
+    timer = threading.Timer(timeout, proc.kill)
+    timer.start()
+    try:
+        try:
+            if key is None:
+                values = list(ijson.items(proc.stdout, "item", use_float=True))
+            else:
+                values = list(ijson.kvitems(proc.stdout, key, use_float=True))
+        except ijson.JSONError as e:
+            values, error = None, e
+        proc.stdout.read()  # Drain whatever follows the extracted values
+        proc.wait()
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+
+    if proc.returncode != 0:
+        return True, None
+    if error is not None:
+        raise ValueError(f"Invalid JSON output: {error}") from error
+    return True, values
+
+
+def _run_json_command(
+    cmd: list[str], key: Optional[str] = None, timeout: int = 60
+) -> tuple[bool, Optional[list]]:
+    """Run a command that prints JSON and extract the values of interest.
+
+    Streams the output through ijson when it is installed, so large listings
+    (e.g. a multi-MB ``npm list -g --json``) are never held in memory whole;
+    otherwise buffers stdout and parses it in one go.
+
+    Args:
+        cmd: Command and arguments as a list
+        key: Top-level object key to extract as (name, value) pairs; if
+            None, extract the elements of a top-level array
+        timeout: Timeout in seconds
+
+    Returns:
+        Tuple of (found, values) like _probe_command; values is None if
+        the command failed
+
+    Raises:
+        ValueError: If the command succeeded but printed invalid JSON
+    """
+    if ijson is not None:
+        return _stream_json_command(cmd, key, timeout)
+
+    found, output = _probe_command(cmd, timeout, binary=True)
+    if output is None:
+        return found, None
+
+    data = _json_parser.loads(output)
+    if key is None:
+        return True, data
+    return True, list(data.get(key, {}).items())
+
+
+def _run_command(
+    cmd: list[str], timeout: int = 60, binary: bool = False
+) -> Optional[Union[str, bytes]]:
+    """Run a command and return its stdout, or None on failure.
+
+    Args:
+        cmd: Command and arguments as a list
+        timeout: Timeout in seconds
+        binary: Return stdout as raw bytes instead of decoded text
+
+    Returns:
+        stdout as string (bytes if binary), or None if command failed
+    """
+    return _probe_command(cmd, timeout, binary)[1]
 
 
+def _package_sort_key(package: dict) -> str:
+    """Case-insensitive sort key for a package entry (tolerates a missing name)."""
+    return (package["name"] or "").casefold()
+
+
+@functools.lru_cache(maxsize=None)
 def _check_command_exists(cmd: str) -> bool:
-    """Check if a command exists in PATH."""
-    return _run_command(["which", cmd]) is not None
+    """Check if a command exists in PATH.
 
+    Uses an in-process PATH lookup instead of spawning ``which``. Results
+    are cached for the life of the process since PATH does not change
+    mid-scan.
+    """
+    return shutil.which(cmd) is not None
 
-def scan_npm_global() -> dict:
+
+def scan_npm_global(include_packages: bool = True) -> dict:
     """Scan globally installed npm packages.
 
+    Args:
+        include_packages: List installed packages; if False, only check
+            whether npm is installed
+
     Returns:
         Dictionary with 'packages' list
     """
@@ -50,66 +201,67 @@ def scan_npm_global() -> dict:
         "errors": [],
     }
 
-    if not _check_command_exists("npm"):
+    if not include_packages:
+        result["installed"] = _check_command_exists("npm")
+        return result
+
+    # Get global packages in JSON format (also detects whether npm exists)
+    try:
+        found, dependencies = _run_json_command(
+            ["npm", "list", "-g", "--depth=0", "--json"], key="dependencies"
+        )
+    except ValueError as e:
+        found, dependencies = True, []
+        result["errors"].append({"error": f"Failed to parse npm JSON output: {e}"})
+
+    if not found:
         return result
 
     result["installed"] = True
 
-    # Get global packages in JSON format
-    output = _run_command(["npm", "list", "-g", "--depth=0", "--json"])
-    if output is None:
+    if dependencies is None:
         # Try without JSON (older npm versions)
         output = _run_command(["npm", "list", "-g", "--depth=0"])
         if output:
             for line in output.split("\n"):
-                line = line.strip()
-                if "@" in line and not line.startswith("/"):
-                    # Parse "package@version" format
-                    # Handle scoped packages like @org/package@version
-                    if line.startswith("├──") or line.startswith("└──"):
-                        line = line.replace("├──", "").replace("└──", "").strip()
-
-                    at_idx = line.rfind("@")
-                    if at_idx > 0:
-                        name = line[:at_idx]
-                        version = line[at_idx + 1 :]
-                        result["packages"].append(
-                            {
-                                "name": name,
-                                "version": version,
-                            }
-                        )
-    else:
-        try:
-            data = json_lib.loads(output)
-            dependencies = data.get("dependencies", {})
-            for name, info in dependencies.items():
-                if isinstance(info, dict):
-                    result["packages"].append(
-                        {
-                            "name": name,
-                            "version": info.get("version"),
-                        }
-                    )
-                else:
+                match = _NPM_TREE_LINE.match(line.strip())
+                if match:
                     result["packages"].append(
                         {
-                            "name": name,
-                            "version": str(info) if info else None,
+                            "name": match["name"],
+                            "version": match["version"],
                         }
                     )
-        except json_lib.JSONDecodeError as e:
-            result["errors"].append({"error": f"Failed to parse npm JSON output: {e}"})
+    else:
+        for name, info in dependencies:
+            if isinstance(info, dict):
+                result["packages"].append(
+                    {
+                        "name": name,
+                        "version": info.get("version"),
+                    }
+                )
+            else:
+                result["packages"].append(
+                    {
+                        "name": name,
+                        "version": str(info) if info else None,
+                    }
+                )
 
-    result["packages"].sort(key=lambda x: x["name"].lower())
+    result["packages"].sort(key=_package_sort_key)
     return result
 
 
-def scan_pip() -> dict:
+def scan_pip(include_packages: bool = True) -> dict:
     """Scan pip installed packages (user site-packages).
 
     Only scans user-installed packages, not system packages.
 
+    Args:
+        include_packages: List installed packages; if False, only check
+            whether pip is installed
+
     Returns:
         Dictionary with 'packages' list
     """
@@ -119,10 +271,20 @@ def scan_pip() -> dict:
         "errors": [],
     }
 
-    # Try pip3 first, then pip
+    if not include_packages:
+        result["installed"] = _check_command_exists("pip3") or _check_command_exists("pip")
+        return result
+
+    # Try pip3 first, then pip; listing user packages doubles as the install check
     pip_cmd = None
+    packages = None
+    json_failed = False
     for cmd in ["pip3", "pip"]:
-        if _check_command_exists(cmd):
+        try:
+            found, packages = _run_json_command([cmd, "list", "--user", "--format=json"])
+        except ValueError:
+            found, json_failed = True, True
+        if found:
             pip_cmd = cmd
             break
 
@@ -131,46 +293,49 @@ def scan_pip() -> dict:
 
     result["installed"] = True
 
-    # Get list of packages in JSON format (user packages only)
-    output = _run_command([pip_cmd, "list", "--user", "--format=json"])
-    if output is None:
+    if packages is None and not json_failed:
         # Try without --user (some systems don't support it)
-        output = _run_command([pip_cmd, "list", "--format=json"])
-
-    if output:
         try:
-            packages = json_lib.loads(output)
-            for pkg in packages:
-                result["packages"].append(
-                    {
-                        "name": pkg.get("name"),
-                        "version": pkg.get("version"),
-                    }
-                )
-        except json_lib.JSONDecodeError:
-            # Fallback to non-JSON format
-            output = _run_command([pip_cmd, "list"])
-            if output:
-                for line in output.split("\n"):
-                    line = line.strip()
-                    if not line or line.startswith("Package") or line.startswith("-"):
-                        continue
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        result["packages"].append(
-                            {
-                                "name": parts[0],
-                                "version": parts[1],
-                            }
-                        )
+            _, packages = _run_json_command([pip_cmd, "list", "--format=json"])
+        except ValueError:
+            json_failed = True
 
-    result["packages"].sort(key=lambda x: x["name"].lower())
+    if json_failed:
+        # Fallback to non-JSON format
+        output = _run_command([pip_cmd, "list"])
+        if output:
+            for line in output.split("\n"):
+                line = line.strip()
+                if not line or line.startswith("Package") or line.startswith("-"):
+                    continue
+                parts = line.split()
+                if len(parts) >= 2:
+                    result["packages"].append(
+                        {
+                            "name": parts[0],
+                            "version": parts[1],
+                        }
+                    )
+    else:
+        for pkg in packages or []:
+            result["packages"].append(
+                {
+                    "name": pkg.get("name"),
+                    "version": pkg.get("version"),
+                }
+            )
+
+    result["packages"].sort(key=_package_sort_key)
     return result
 
 
-def scan_pipx() -> dict:
+def scan_pipx(include_packages: bool = True) -> dict:
     """Scan pipx installed applications.
 
+    Args:
+        include_packages: List installed packages; if False, only check
+            whether pipx is installed
+
     Returns:
         Dictionary with 'packages' list
     """
@@ -180,28 +345,32 @@ def scan_pipx() -> dict:
         "errors": [],
     }
 
-    if not _check_command_exists("pipx"):
+    if not include_packages:
+        result["installed"] = _check_command_exists("pipx")
+        return result
+
+    # Get list of packages in JSON format (also detects whether pipx exists)
+    try:
+        found, venvs = _run_json_command(["pipx", "list", "--json"], key="venvs")
+    except ValueError as e:
+        found, venvs = True, []
+        result["errors"].append({"error": f"Failed to parse pipx JSON: {e}"})
+
+    if not found:
         return result
 
     result["installed"] = True
 
-    # Get list of packages in JSON format
-    output = _run_command(["pipx", "list", "--json"])
-    if output:
-        try:
-            data = json_lib.loads(output)
-            venvs = data.get("venvs", {})
-            for name, info in venvs.items():
-                metadata = info.get("metadata", {}).get("main_package", {})
-                result["packages"].append(
-                    {
-                        "name": name,
-                        "version": metadata.get("package_version"),
-                        "python_version": metadata.get("python_version"),
-                    }
-                )
-        except json_lib.JSONDecodeError as e:
-            result["errors"].append({"error": f"Failed to parse pipx JSON: {e}"})
+    if venvs is not None:
+        for name, info in venvs:
+            metadata = info.get("metadata", {}).get("main_package", {})
+            result["packages"].append(
+                {
+                    "name": name,
+                    "version": metadata.get("package_version"),
+                    "python_version": metadata.get("python_version"),
+                }
+            )
     else:
         # Fallback to non-JSON
         output = _run_command(["pipx", "list"])
@@ -220,13 +389,17 @@ def scan_pipx() -> dict:
                         }
                     )
 
-    result["packages"].sort(key=lambda x: x["name"].lower())
+    result["packages"].sort(key=_package_sort_key)
     return result
 
 
-def scan_cargo() -> dict:
+def scan_cargo(include_packages: bool = True) -> dict:
     """Scan cargo installed packages.
 
+    Args:
+        include_packages: List installed packages; if False, only check
+            whether cargo is installed
+
     Returns:
         Dictionary with 'packages' list
     """
@@ -236,13 +409,17 @@ def scan_cargo() -> dict:
         "errors": [],
     }
 
-    if not _check_command_exists("cargo"):
+    if not include_packages:
+        result["installed"] = _check_command_exists("cargo")
+        return result
+
+    # cargo install --list shows installed packages (and fails if cargo is missing)
+    found, output = _probe_command(["cargo", "install", "--list"])
+    if not found:
         return result
 
     result["installed"] = True
 
-    # cargo install --list shows installed packages
-    output = _run_command(["cargo", "install", "--list"])
     if output:
         for line in output.split("\n"):
             line = line.strip()
@@ -263,13 +440,19 @@ def scan_cargo() -> dict:
                         }
                     )
 
-    result["packages"].sort(key=lambda x: x["name"].lower())
+    result["packages"].sort(key=_package_sort_key)
     return result
 
 
-def scan_gem() -> dict:
+def scan_gem(include_packages: bool = True, include_all_versions: bool = False) -> dict:
     """Scan gem installed packages.
 
+    Args:
+        include_packages: List installed packages; if False, only check
+            whether gem is installed
+        include_all_versions: Also record every installed version of each
+            gem under 'all_versions', not just the latest
+
     Returns:
         Dictionary with 'packages' list
     """
@@ -279,13 +462,17 @@ def scan_gem() -> dict:
         "errors": [],
     }
 
-    if not _check_command_exists("gem"):
+    if not include_packages:
+        result["installed"] = _check_command_exists("gem")
+        return result
+
+    # Get list of user-installed gems (also detects whether gem exists)
+    found, output = _probe_command(["gem", "list", "--local"])
+    if not found:
         return result
 
     result["installed"] = True
 
-    # Get list of user-installed gems
-    output = _run_command(["gem", "list", "--local"])
     if output:
         for line in output.split("\n"):
             line = line.strip()
@@ -296,24 +483,37 @@ def scan_gem() -> dict:
             if "(" in line and ")" in line:
                 paren_start = line.index("(")
                 name = line[:paren_start].strip()
-                versions_str = line[paren_start + 1 : -1]
-                # Take the first (latest) version
-                versions = [v.strip() for v in versions_str.split(",")]
-                result["packages"].append(
-                    {
-                        "name": name,
-                        "version": versions[0] if versions else None,
-                        "all_versions": versions,
-                    }
-                )
+                if include_all_versions:
+                    versions_str = line[paren_start + 1 : -1]
+                    versions = [v.strip() for v in versions_str.split(",")]
+                    result["packages"].append(
+                        {
+                            "name": name,
+                            "version": versions[0],
+                            "all_versions": versions,
+                        }
+                    )
+                else:
+                    # Take the first (latest) version
+                    version_end = line.find(",", paren_start)
+                    result["packages"].append(
+                        {
+                            "name": name,
+                            "version": line[paren_start + 1 : version_end].strip(),
+                        }
+                    )
 
-    result["packages"].sort(key=lambda x: x["name"].lower())
+    result["packages"].sort(key=_package_sort_key)
     return result
 
 
-def scan_go() -> dict:
+def scan_go(include_packages: bool = True) -> dict:
     """Scan Go installed binaries.
 
+    Args:
+        include_packages: List installed packages; if False, only check
+            whether go is installed
+
     Returns:
         Dictionary with 'packages' list
     """
@@ -323,47 +523,70 @@ def scan_go() -> dict:
         "errors": [],
     }
 
-    if not _check_command_exists("go"):
+    if not include_packages:
+        result["installed"] = _check_command_exists("go")
+        return result
+
+    # Query GOPATH and GOBIN in one call; the JSON form names each value,
+    # so an empty one can't shift the other into its place
+    found, output = _probe_command(["go", "env", "-json", "GOPATH", "GOBIN"], binary=True)
+    if not found:
         return result
 
     result["installed"] = True
 
-    # Check GOPATH/bin or GOBIN for installed binaries
-    gopath = _run_command(["go", "env", "GOPATH"])
-    gobin = _run_command(["go", "env", "GOBIN"])
+    go_env = {}
+    if output:
+        try:
+            go_env = _json_parser.loads(output)
+        except ValueError as e:
+            result["errors"].append({"error": f"Failed to parse go env JSON: {e}"})
+    gopath = (go_env.get("GOPATH") or "").strip()
+    gobin = (go_env.get("GOBIN") or "").strip()
 
     bin_dir = None
     if gobin:
-        bin_dir = Path(gobin)
+        bin_dir = gobin
     elif gopath:
-        bin_dir = Path(gopath) / "bin"
+        bin_dir = os.path.join(gopath, "bin")
 
-    if bin_dir and bin_dir.exists():
-        for binary in bin_dir.iterdir():
-            if binary.is_file() and not binary.name.startswith("."):
-                result["packages"].append(
-                    {
-                        "name": binary.name,
-                        "path": str(binary),
-                    }
-                )
+    if bin_dir:
+        try:
+            # scandir reports entry types from the directory read itself,
+            # so only symlinks need a stat to tell files from directories
+            with os.scandir(bin_dir) as entries:
+                for entry in entries:
+                    if not entry.name.startswith(".") and entry.is_file():
+                        result["packages"].append(
+                            {
+                                "name": entry.name,
+                                "path": entry.path,
+                            }
+                        )
+        except OSError:
+            pass
 
-    result["packages"].sort(key=lambda x: x["name"].lower())
+    result["packages"].sort(key=_package_sort_key)
     return result
 
 
-def scan() -> dict:
+def scan(include_packages: bool = True) -> dict:
     """Scan all global package managers.
 
+    Args:
+        include_packages: List installed packages; if False, only check
+            which package managers are installed (no list commands run)
+
     Returns:
         Dictionary with results from all package managers
     """
-    npm_result = scan_npm_global()
-    pip_result = scan_pip()
-    pipx_result = scan_pipx()
-    cargo_result = scan_cargo()
-    gem_result = scan_gem()
-    go_result = scan_go()
+    # Each manager only waits on its own subprocesses, so run them side by side
+    scanners = (scan_npm_global, scan_pip, scan_pipx, scan_cargo, scan_gem, scan_go)
+    with ThreadPoolExecutor(max_workers=len(scanners)) as executor:
+        futures = [executor.submit(scanner, include_packages) for scanner in scanners]
+        npm_result, pip_result, pipx_result, cargo_result, gem_result, go_result = (
+            future.result() for future in futures
+        )
 
     return {
         "npm": {
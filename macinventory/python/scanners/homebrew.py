@@ -5,8 +5,14 @@ comprehensive package inventory.
 """
 
 import subprocess
+import time
 from typing import Optional
 
+# brew subcommands behind scan_formulae, scan_casks, and scan_taps
+_FORMULAE_CMD = ["brew", "list", "--formula", "--versions"]
+_CASKS_CMD = ["brew", "list", "--cask", "--versions"]
+_TAPS_CMD = ["brew", "tap"]
+
 
 def _run_command(cmd: list[str], timeout: int = 60) -> Optional[str]:
     """Run a command and return its stdout, or None on failure.
@@ -32,21 +38,73 @@ def _run_command(cmd: list[str], timeout: int = 60) -> Optional[str]:
         return None
 
 
+def _run_commands_parallel(cmds: list[list[str]], timeout: int = 60) -> list[Optional[str]]:
+    """Run several commands concurrently and return each one's stdout.
+
+    Homebrew spends most of its runtime starting up, so launching the brew
+    subcommands side by side costs roughly one startup instead of one each.
+
+    Args:
+        cmds: Commands to run, each as a list of arguments
+        timeout: Timeout in seconds shared by all commands
+
+    Returns:
+        List of stdout strings in the same order as cmds, with None for
+        any command that failed
+    """
+    procs: list[Optional[subprocess.Popen]] = []
+    for cmd in cmds:
+        try:
+            procs.append(
+                subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                )
+            )
+        except OSError:
+            procs.append(None)
+
+    deadline = time.monotonic() + timeout
+    outputs: list[Optional[str]] = []
+    for proc in procs:
+        if proc is None:
+            outputs.append(None)
+            continue
+        try:
+            stdout, _ = proc.communicate(timeout=max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            outputs.append(None)
+            continue
+        outputs.append(stdout.strip() if proc.returncode == 0 else None)
+
+    return outputs
+
+
 def _check_homebrew_installed() -> bool:
     """Check if Homebrew is installed and accessible."""
     return _run_command(["brew", "--version"]) is not None
 
 
-def scan_formulae() -> dict:
+def scan_formulae(installed: Optional[bool] = None, include_all_versions: bool = False) -> dict:
     """Scan installed Homebrew formulae.
 
+    Args:
+        installed: Result of a prior Homebrew install check, to avoid
+            re-running ``brew --version`` (checked here if None)
+        include_all_versions: Also record every installed version of each
+            formula under 'all_versions', not just the first
+
     Returns:
         Dictionary with 'formulae' list containing package info
     """
-    formulae = []
-    errors = []
+    if installed is None:
+        installed = _check_homebrew_installed()
 
-    if not _check_homebrew_installed():
+    if not installed:
         return {
             "formulae": [],
             "count": 0,
@@ -54,7 +112,22 @@ def scan_formulae() -> dict:
         }
 
     # Get list of installed formulae with versions
-    output = _run_command(["brew", "list", "--formula", "--versions"])
+    return _parse_formulae(_run_command(_FORMULAE_CMD), include_all_versions)
+
+
+def _parse_formulae(output: Optional[str], include_all_versions: bool = False) -> dict:
+    """Build the scan_formulae result from 'brew list --formula' output.
+
+    Args:
+        output: Command stdout, or None if the command failed
+        include_all_versions: Include the 'all_versions' list per formula
+
+    Returns:
+        Dictionary with 'formulae' list containing package info
+    """
+    formulae = []
+    errors = []
+
     if output is None:
         errors.append({"error": "Failed to run 'brew list --formula'"})
     else:
@@ -62,24 +135,13 @@ def scan_formulae() -> dict:
             if not line.strip():
                 continue
             parts = line.split()
-            if len(parts) >= 2:
-                name = parts[0]
-                versions = parts[1:]  # Some packages have multiple versions
-                formulae.append(
-                    {
-                        "name": name,
-                        "version": versions[0] if versions else None,
-                        "all_versions": versions,
-                    }
-                )
-            elif len(parts) == 1:
-                formulae.append(
-                    {
-                        "name": parts[0],
-                        "version": None,
-                        "all_versions": [],
-                    }
-                )
+            formula = {
+                "name": parts[0],
+                "version": parts[1] if len(parts) >= 2 else None,
+            }
+            if include_all_versions:
+                formula["all_versions"] = parts[1:]  # Some packages have multiple versions
+            formulae.append(formula)
 
     return {
         "formulae": formulae,
@@ -88,16 +150,20 @@ def scan_formulae() -> dict:
     }
 
 
-def scan_casks() -> dict:
+def scan_casks(installed: Optional[bool] = None) -> dict:
     """Scan installed Homebrew casks.
 
+    Args:
+        installed: Result of a prior Homebrew install check, to avoid
+            re-running ``brew --version`` (checked here if None)
+
     Returns:
         Dictionary with 'casks' list containing package info
     """
-    casks = []
-    errors = []
+    if installed is None:
+        installed = _check_homebrew_installed()
 
-    if not _check_homebrew_installed():
+    if not installed:
         return {
             "casks": [],
             "count": 0,
@@ -105,7 +171,21 @@ def scan_casks() -> dict:
         }
 
     # Get list of installed casks with versions
-    output = _run_command(["brew", "list", "--cask", "--versions"])
+    return _parse_casks(_run_command(_CASKS_CMD))
+
+
+def _parse_casks(output: Optional[str]) -> dict:
+    """Build the scan_casks result from 'brew list --cask' output.
+
+    Args:
+        output: Command stdout, or None if the command failed
+
+    Returns:
+        Dictionary with 'casks' list containing package info
+    """
+    casks = []
+    errors = []
+
     if output is None:
         errors.append({"error": "Failed to run 'brew list --cask'"})
     else:
@@ -137,23 +217,41 @@ def scan_casks() -> dict:
     }
 
 
-def scan_taps() -> dict:
+def scan_taps(installed: Optional[bool] = None) -> dict:
     """Scan tapped Homebrew repositories.
 
+    Args:
+        installed: Result of a prior Homebrew install check, to avoid
+            re-running ``brew --version`` (checked here if None)
+
     Returns:
         Dictionary with 'taps' list
     """
-    taps = []
-    errors = []
+    if installed is None:
+        installed = _check_homebrew_installed()
 
-    if not _check_homebrew_installed():
+    if not installed:
         return {
             "taps": [],
             "count": 0,
             "errors": [{"error": "Homebrew not installed"}],
         }
 
-    output = _run_command(["brew", "tap"])
+    return _parse_taps(_run_command(_TAPS_CMD))
+
+
+def _parse_taps(output: Optional[str]) -> dict:
+    """Build the scan_taps result from 'brew tap' output.
+
+    Args:
+        output: Command stdout, or None if the command failed
+
+    Returns:
+        Dictionary with 'taps' list
+    """
+    taps = []
+    errors = []
+
     if output is None:
         errors.append({"error": "Failed to run 'brew tap'"})
     else:
@@ -237,14 +335,26 @@ def scan_mas() -> dict:
 def scan() -> dict:
     """Scan all Homebrew-related package sources.
 
-    Combines results from formulae, casks, and taps.
+    Combines results from formulae, casks, and taps. The three brew
+    subcommands run concurrently so their startup costs overlap.
 
     Returns:
         Dictionary with all Homebrew package information
     """
-    formulae_result = scan_formulae()
-    casks_result = scan_casks()
-    taps_result = scan_taps()
+    # Check once; each brew startup is slow
+    installed = _check_homebrew_installed()
+
+    if installed:
+        formulae_output, casks_output, taps_output = _run_commands_parallel(
+            [_FORMULAE_CMD, _CASKS_CMD, _TAPS_CMD]
+        )
+        formulae_result = _parse_formulae(formulae_output)
+        casks_result = _parse_casks(casks_output)
+        taps_result = _parse_taps(taps_output)
+    else:
+        formulae_result = scan_formulae(installed)
+        casks_result = scan_casks(installed)
+        taps_result = scan_taps(installed)
 
     return {
         "formulae": formulae_result["formulae"],
@@ -3,7 +3,9 @@
 Scans for installed version managers and their managed runtime versions.
 """
 
+import functools
 import os
+import shutil
 import subprocess
 from pathlib import Path
 from typing import Optional
@@ -21,8 +23,10 @@ def _run_command(cmd: list[str], timeout: int = 30, env: Optional[dict] = None)
         stdout as string, or None if command failed
     """
     try:
-        run_env = os.environ.copy()
+        # env=None lets the child inherit our environment without a copy
+        run_env = None
         if env:
+            run_env = os.environ.copy()
             run_env.update(env)
 
         result = subprocess.run(
@@ -39,9 +43,63 @@ def _run_command(cmd: list[str], timeout: int = 30, env: Optional[dict] = None)
         return None
 
 
+@functools.lru_cache(maxsize=None)
 def _check_command_exists(cmd: str) -> bool:
-    """Check if a command exists in PATH."""
-    return _run_command(["which", cmd]) is not None
+    """Check if a command exists in PATH.
+
+    Uses an in-process PATH lookup instead of spawning ``which``. Results
+    are cached for the life of the process since PATH does not change
+    mid-scan.
+    """
+    return shutil.which(cmd) is not None
+
+
+def _version_sort_key(version: str) -> tuple[int, ...]:
+    """Sort key ordering dotted versions numerically (e.g. 9.x before 10.x)."""
+    return tuple(int(part) for part in version.split(".") if part.isdigit())
+
+
+def _read_small_file(path: Path) -> Optional[str]:
+    """Read a small text file such as a version pin.
+
+    Opens the file directly rather than checking exists() first; a missing
+    file is reported by the failed open.
+
+    Args:
+        path: File to read
+
+    Returns:
+        Stripped file contents, or None if the file can't be read
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    return data.decode("utf-8", errors="replace").strip()
+
+
+def _list_subdirectories(directory: Path) -> Optional[list[str]]:
+    """List the names of visible subdirectories of a directory.
+
+    Uses os.scandir so entry types come from the directory listing itself
+    rather than a separate stat per entry.
+
+    Args:
+        directory: Directory to list
+
+    Returns:
+        List of subdirectory names, or None if the directory can't be read
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if not entry.name.startswith(".") and entry.is_dir()
+            ]
+    except OSError:
+        return None
 
 
 def scan_pyenv() -> dict:
@@ -65,11 +123,9 @@ def scan_pyenv() -> dict:
     result["installed"] = True
 
     # Get installed versions from directory
-    versions_dir = pyenv_root / "versions"
-    if versions_dir.exists():
-        for version_path in versions_dir.iterdir():
-            if version_path.is_dir() and not version_path.name.startswith("."):
-                result["versions"].append(version_path.name)
+    versions = _list_subdirectories(pyenv_root / "versions")
+    if versions is not None:
+        result["versions"] = versions
     else:
         # Try pyenv command
         output = _run_command(["pyenv", "versions", "--bare"])
@@ -77,12 +133,7 @@ def scan_pyenv() -> dict:
             result["versions"] = [v.strip() for v in output.split("\n") if v.strip()]
 
     # Get global version
-    global_file = pyenv_root / "version"
-    if global_file.exists():
-        try:
-            result["global_version"] = global_file.read_text().strip()
-        except OSError:
-            pass
+    result["global_version"] = _read_small_file(pyenv_root / "version")
 
     result["versions"].sort()
     return result
@@ -109,26 +160,16 @@ def scan_nvm() -> dict:
     result["installed"] = True
 
     # Get installed versions from directory
-    versions_dir = nvm_dir / "versions" / "node"
-    if versions_dir.exists():
-        for version_path in versions_dir.iterdir():
-            if version_path.is_dir():
-                # Remove 'v' prefix if present
-                version = version_path.name
-                if version.startswith("v"):
-                    version = version[1:]
-                result["versions"].append(version)
+    for version in _list_subdirectories(nvm_dir / "versions" / "node") or []:
+        # Remove 'v' prefix if present
+        if version.startswith("v"):
+            version = version[1:]
+        result["versions"].append(version)
 
     # Get default version from alias
-    alias_dir = nvm_dir / "alias"
-    default_file = alias_dir / "default"
-    if default_file.exists():
-        try:
-            result["default_version"] = default_file.read_text().strip()
-        except OSError:
-            pass
-
-    result["versions"].sort(key=lambda v: [int(x) for x in v.split(".") if x.isdigit()])
+    result["default_version"] = _read_small_file(nvm_dir / "alias" / "default")
+
+    result["versions"].sort(key=_version_sort_key)
     return result
 
 
@@ -153,11 +194,9 @@ def scan_rbenv() -> dict:
     result["installed"] = True
 
     # Get installed versions from directory
-    versions_dir = rbenv_root / "versions"
-    if versions_dir.exists():
-        for version_path in versions_dir.iterdir():
-            if version_path.is_dir() and not version_path.name.startswith("."):
-                result["versions"].append(version_path.name)
+    versions = _list_subdirectories(rbenv_root / "versions")
+    if versions is not None:
+        result["versions"] = versions
     else:
         # Try rbenv command
         output = _run_command(["rbenv", "versions", "--bare"])
@@ -165,12 +204,7 @@ def scan_rbenv() -> dict:
             result["versions"] = [v.strip() for v in output.split("\n") if v.strip()]
 
     # Get global version
-    global_file = rbenv_root / "version"
-    if global_file.exists():
-        try:
-            result["global_version"] = global_file.read_text().strip()
-        except OSError:
-            pass
+    result["global_version"] = _read_small_file(rbenv_root / "version")
 
     result["versions"].sort()
     return result
@@ -199,39 +233,26 @@ def scan_asdf() -> dict:
     plugins_dir = asdf_dir / "plugins"
     installs_dir = asdf_dir / "installs"
 
-    if plugins_dir.exists():
-        for plugin_path in plugins_dir.iterdir():
-            if plugin_path.is_dir():
-                plugin_name = plugin_path.name
-                versions = []
-
-                # Get versions from installs directory
-                plugin_installs = installs_dir / plugin_name
-                if plugin_installs.exists():
-                    for version_path in plugin_installs.iterdir():
-                        if version_path.is_dir():
-                            versions.append(version_path.name)
+    for plugin_name in _list_subdirectories(plugins_dir) or []:
+        # Get versions from installs directory
+        versions = _list_subdirectories(installs_dir / plugin_name) or []
 
-                result["plugins"][plugin_name] = {
-                    "versions": sorted(versions),
-                    "count": len(versions),
-                }
+        result["plugins"][plugin_name] = {
+            "versions": sorted(versions),
+            "count": len(versions),
+        }
 
     # Get global tool versions
-    tool_versions_file = Path.home() / ".tool-versions"
-    if tool_versions_file.exists():
-        try:
-            tool_versions = {}
-            content = tool_versions_file.read_text()
-            for line in content.split("\n"):
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        tool_versions[parts[0]] = parts[1]
-            result["global_versions"] = tool_versions
-        except OSError:
-            pass
+    content = _read_small_file(Path.home() / ".tool-versions")
+    if content is not None:
+        tool_versions = {}
+        for line in content.split("\n"):
+            line = line.strip()
+            if line and not line.startswith("#"):
+                parts = line.split()
+                if len(parts) >= 2:
+                    tool_versions[parts[0]] = parts[1]
+        result["global_versions"] = tool_versions
 
     return result
 
@@ -257,21 +278,12 @@ def scan_nodenv() -> dict:
     result["installed"] = True
 
     # Get installed versions from directory
-    versions_dir = nodenv_root / "versions"
-    if versions_dir.exists():
-        for version_path in versions_dir.iterdir():
-            if version_path.is_dir() and not version_path.name.startswith("."):
-                result["versions"].append(version_path.name)
+    result["versions"] = _list_subdirectories(nodenv_root / "versions") or []
 
     # Get global version
-    global_file = nodenv_root / "version"
-    if global_file.exists():
-        try:
-            result["global_version"] = global_file.read_text().strip()
-        except OSError:
-            pass
-
-    result["versions"].sort(key=lambda v: [int(x) for x in v.split(".") if x.isdigit()])
+    result["global_version"] = _read_small_file(nodenv_root / "version")
+
+    result["versions"].sort(key=_version_sort_key)
     return result
 
 
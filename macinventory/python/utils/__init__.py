@@ -27,6 +27,8 @@ from .file_ops import (
     prepare_for_copy,
     normalize_destination_permissions,
     clear_destination_attributes,
+    finalize_destination,
+    bulk_clear_attributes,
 )
 
 from .storage_detection import (
@@ -59,6 +61,8 @@ __all__ = [
     'prepare_for_copy',
     'normalize_destination_permissions',
     'clear_destination_attributes',
+    'finalize_destination',
+    'bulk_clear_attributes',
     # storage_detection
     'detect_onedrive',
     'detect_all_onedrive',
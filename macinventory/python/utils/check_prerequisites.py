@@ -14,133 +14,379 @@ Usage:
     results = check_all_prerequisites()
 """
 
-import subprocess
+import functools
 import json
+import os
+import shlex
+import shutil
 import sys
 import re
-from typing import Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+# Successful tool checks are cached here, keyed by the resolved executable's
+# path, mtime and size, so unchanged tools aren't re-run on every invocation
+CACHE_FILE = Path.home() / ".cache" / "macinventory" / "prereqs.json"
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+_cache_lock = threading.Lock()
+
+
+def _load_cache() -> dict:
+    """Load the prerequisite cache, returning an empty cache if unreadable."""
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_cache_entry(name: str, entry: dict) -> None:
+    """Merge one entry into the prerequisite cache file.
+
+    The file is rewritten atomically; failures are ignored since the cache
+    is only an optimization.
+    """
+    with _cache_lock:
+        cache = _load_cache()
+        cache[name] = entry
+        try:
+            CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = CACHE_FILE.with_name(f"{CACHE_FILE.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cache, f, indent=2)
+            os.replace(tmp_path, CACHE_FILE)
+        except OSError:
+            pass
+
+
+def _cache_key(name: str, path: str) -> Optional[str]:
+    """Build the cache key for a tool from its executable's identity.
+
+    Args:
+        name: Check name
+        path: Resolved path of the tool's executable
+
+    Returns:
+        Cache key, or None if the executable can't be stat'ed
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f"{name}:{path}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def _lookup_cache(name: str, key: str) -> Optional[tuple[bool, Optional[str], Optional[str]]]:
+    """Return the cached result for a check if its key matches and is fresh."""
+    entry = _load_cache().get(name)
+    if (
+        isinstance(entry, dict)
+        and entry.get("key") == key
+        and time.time() - entry.get("checked_at", 0) < CACHE_TTL_SECONDS
+    ):
+        return True, entry.get("version"), None
+    return None
+
+
+def _store_cache(
+    name: str, key: Optional[str], result: tuple[bool, Optional[str], Optional[str]]
+) -> None:
+    """Cache a check result under key (only successes are cached)."""
+    available, version, _ = result
+    # A failure may be transient and is cheap to re-check
+    if key is not None and available:
+        _save_cache_entry(name, {"key": key, "checked_at": time.time(), "version": version})
+
+
+def _cached_check(
+    name: str,
+    executable: str,
+    run_check: Callable[[], tuple[bool, Optional[str], Optional[str]]],
+    missing_error: str,
+    use_cache: bool = True,
+) -> tuple[bool, Optional[str], Optional[str]]:
+    """Run a tool check, reusing a cached result if the tool is unchanged.
+
+    A tool that isn't on PATH is reported missing without spawning anything.
+
+    Args:
+        name: Check name, used as the cache entry name
+        executable: Command whose binary identifies the cached result
+        run_check: Performs the actual check when there is no usable entry
+        missing_error: Error message when executable isn't on PATH
+        use_cache: Set False to always run the check
+
+    Returns:
+        Tuple of (is_available, version, error_message)
+    """
+    path = shutil.which(executable)
+    if path is None:
+        return False, None, missing_error
+
+    if not use_cache:
+        return run_check()
+
+    key = _cache_key(name, path)
+    if key is not None:
+        cached = _lookup_cache(name, key)
+        if cached is not None:
+            return cached
+
+    result = run_check()
+    _store_cache(name, key, result)
+    return result
 
 
 def check_python3() -> tuple[bool, Optional[str], Optional[str]]:
     """Check Python 3 availability and version.
 
+    Reports the running interpreter, which is the python3 the inventory
+    scripts run under, rather than spawning ``python3 --version``.
+
     Returns:
         Tuple of (is_available, version, error_message)
     """
-    try:
-        result = subprocess.run(
-            ["python3", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        if result.returncode == 0:
-            # Output format: "Python 3.12.1"
-            output = result.stdout.strip() or result.stderr.strip()
-            match = re.search(r"Python (\d+\.\d+(?:\.\d+)?)", output)
-            version = match.group(1) if match else output
-            return True, version, None
-        return False, None, "python3 returned non-zero exit code"
-    except FileNotFoundError:
-        return False, None, "python3 not found"
-    except subprocess.TimeoutExpired:
-        return False, None, "Timeout checking Python version"
-    except Exception as e:
-        return False, None, f"Error: {e}"
+    v = sys.version_info
+    return True, f"{v.major}.{v.minor}.{v.micro}", None
 
 
 def check_pyyaml() -> tuple[bool, Optional[str], Optional[str]]:
     """Check PyYAML availability and version.
 
+    Imports PyYAML in the running interpreter, which is the one the inventory
+    scripts will import it from, instead of spawning a second python3.
+
     Returns:
         Tuple of (is_available, version, error_message)
     """
     try:
-        result = subprocess.run(
-            ["python3", "-c", "import yaml; print(yaml.__version__)"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        if result.returncode == 0:
-            version = result.stdout.strip()
-            return True, version, None
-        # Check if it's an import error
-        stderr = result.stderr.strip()
-        if "ModuleNotFoundError" in stderr or "ImportError" in stderr:
-            return False, None, "PyYAML not installed"
-        return False, None, stderr or "Unknown error"
-    except FileNotFoundError:
-        return False, None, "python3 not found"
-    except subprocess.TimeoutExpired:
-        return False, None, "Timeout checking PyYAML"
+        import yaml
+    except ImportError:
+        return False, None, "PyYAML not installed"
     except Exception as e:
         return False, None, f"Error: {e}"
+    return True, getattr(yaml, "__version__", None), None
 
 
-def check_homebrew() -> tuple[bool, Optional[str], Optional[str]]:
-    """Check Homebrew availability and version.
+def _parse_homebrew_version(output: str) -> str:
+    """Extract the version from ``brew --version`` output."""
+    # Output format: "Homebrew 4.4.0"
+    first_line = output.strip().split("\n")[0]
+    match = re.search(r"Homebrew (\d+\.\d+(?:\.\d+)?)", first_line)
+    return match.group(1) if match else first_line
+
+
+def _parse_mas_version(output: str) -> str:
+    """Extract the version from ``mas version`` output."""
+    return output.strip()
+
+
+@dataclass(frozen=True)
+class Probe:
+    """An optional tool checked by running it and parsing its version.
+
+    Attributes:
+        name: Check name, also used for the cache entry
+        label: Tool name used in error messages
+        argv: Command that prints the version
+        parse_version: Extracts the version from the command's stdout
+    """
+    name: str
+    label: str
+    argv: tuple[str, ...]
+    parse_version: Callable[[str], str]
+
+    @property
+    def missing_error(self) -> str:
+        return f"{self.label} not installed"
+
+    def result(self, returncode: int, stdout: str) -> tuple[bool, Optional[str], Optional[str]]:
+        """Turn the command's exit code and stdout into a check result."""
+        if returncode == 0:
+            return True, self.parse_version(stdout), None
+        return False, None, f"{self.argv[0]} returned non-zero exit code"
+
+
+PROBES = {
+    "homebrew": Probe("homebrew", "Homebrew", ("brew", "--version"), _parse_homebrew_version),
+    "mas": Probe("mas", "mas", ("mas", "version"), _parse_mas_version),
+}
+
+
+def _probe(spec: Probe) -> tuple[bool, Optional[str], Optional[str]]:
+    """Run a probe's command and parse the result.
+
+    Args:
+        spec: The tool to probe
 
     Returns:
         Tuple of (is_available, version, error_message)
     """
+    import subprocess
+
     try:
         result = subprocess.run(
-            ["brew", "--version"],
+            list(spec.argv),
             capture_output=True,
             text=True,
             timeout=10
         )
-        if result.returncode == 0:
-            # Output format: "Homebrew 4.4.0"
-            output = result.stdout.strip().split("\n")[0]
-            match = re.search(r"Homebrew (\d+\.\d+(?:\.\d+)?)", output)
-            version = match.group(1) if match else output
-            return True, version, None
-        return False, None, "brew returned non-zero exit code"
+        return spec.result(result.returncode, result.stdout)
     except FileNotFoundError:
-        return False, None, "Homebrew not installed"
+        return False, None, spec.missing_error
     except subprocess.TimeoutExpired:
-        return False, None, "Timeout checking Homebrew"
+        return False, None, f"Timeout checking {spec.label}"
     except Exception as e:
         return False, None, f"Error: {e}"
 
 
-def check_mas() -> tuple[bool, Optional[str], Optional[str]]:
+def _check_probe(spec: Probe, use_cache: bool = True) -> tuple[bool, Optional[str], Optional[str]]:
+    """Check one tool from PROBES, through the cache."""
+    return _cached_check(
+        spec.name, spec.argv[0], functools.partial(_probe, spec), spec.missing_error, use_cache
+    )
+
+
+def check_homebrew(use_cache: bool = True) -> tuple[bool, Optional[str], Optional[str]]:
+    """Check Homebrew availability and version.
+
+    Args:
+        use_cache: Reuse a cached result while brew is unchanged
+
+    Returns:
+        Tuple of (is_available, version, error_message)
+    """
+    return _check_probe(PROBES["homebrew"], use_cache)
+
+
+def check_mas(use_cache: bool = True) -> tuple[bool, Optional[str], Optional[str]]:
     """Check mas (Mac App Store CLI) availability and version.
 
+    Args:
+        use_cache: Reuse a cached result while mas is unchanged
+
     Returns:
         Tuple of (is_available, version, error_message)
     """
+    return _check_probe(PROBES["mas"], use_cache)
+
+
+_RC_MARKER_RE = re.compile(r"==rc:(\d+)==\n?")
+
+
+def _run_probes_together(specs: list[Probe]) -> Optional[dict[str, tuple[bool, Optional[str], Optional[str]]]]:
+    """Run several probes in a single ``sh -c`` instead of one spawn each.
+
+    Each command is followed by an echo of its exit code, which also marks
+    where its output ends.
+
+    Args:
+        specs: The tools to probe
+
+    Returns:
+        Dictionary mapping each probe name to (is_available, version,
+        error_message), or None if the shell output couldn't be split
+    """
+    import subprocess
+
+    script = "; ".join(
+        f'{shlex.join(spec.argv)} 2>/dev/null; echo "==rc:$?=="' for spec in specs
+    )
     try:
         result = subprocess.run(
-            ["mas", "version"],
+            ["/bin/sh", "-c", script],
             capture_output=True,
             text=True,
-            timeout=10
+            timeout=10 * len(specs)  # Same budget per tool as separate checks
         )
-        if result.returncode == 0:
-            version = result.stdout.strip()
-            return True, version, None
-        return False, None, "mas returned non-zero exit code"
-    except FileNotFoundError:
-        return False, None, "mas not installed"
     except subprocess.TimeoutExpired:
-        return False, None, "Timeout checking mas"
+        return {spec.name: (False, None, f"Timeout checking {spec.label}") for spec in specs}
     except Exception as e:
-        return False, None, f"Error: {e}"
+        return {spec.name: (False, None, f"Error: {e}") for spec in specs}
+
+    # [output 1, exit code 1, output 2, exit code 2, ..., trailing]
+    parts = _RC_MARKER_RE.split(result.stdout)
+    if len(parts) != 2 * len(specs) + 1:
+        return None
+
+    return {
+        spec.name: spec.result(int(parts[2 * i + 1]), parts[2 * i])
+        for i, spec in enumerate(specs)
+    }
+
 
+def check_optional_tools(use_cache: bool = True) -> dict[str, tuple[bool, Optional[str], Optional[str]]]:
+    """Check every tool in PROBES (Homebrew and mas).
 
-def check_all_prerequisites() -> dict:
+    Tools missing from PATH or answered from the cache are skipped; if more
+    than one still needs probing they share one shell instead of a spawn
+    each.
+
+    Args:
+        use_cache: Reuse cached results while the tools are unchanged
+
+    Returns:
+        Dictionary mapping each probe name to (is_available, version,
+        error_message)
+    """
+    results = {}
+    pending = {}
+
+    for name, spec in PROBES.items():
+        path = shutil.which(spec.argv[0])
+        if path is None:
+            results[name] = (False, None, spec.missing_error)
+            continue
+        key = _cache_key(name, path) if use_cache else None
+        cached = _lookup_cache(name, key) if key is not None else None
+        if cached is not None:
+            results[name] = cached
+        else:
+            pending[name] = key
+
+    bundled = None
+    if len(pending) > 1:
+        bundled = _run_probes_together([PROBES[name] for name in pending])
+    for name, key in pending.items():
+        if bundled is not None:
+            results[name] = bundled[name]
+            _store_cache(name, key, results[name])
+        else:
+            results[name] = _check_probe(PROBES[name], use_cache)
+
+    return results
+
+
+def check_all_prerequisites(use_cache: bool = True) -> dict:
     """Run all prerequisite checks and return structured results.
 
+    Args:
+        use_cache: Reuse cached tool checks (see CACHE_FILE)
+
     Returns:
         Dictionary with status, checks, and summary
     """
     checks = {}
 
+    # The optional tools are probed in a subprocess; overlap that with the
+    # in-process python3 and PyYAML checks (which have nothing to cache)
+    check_fns = {
+        "python3": check_python3,
+        "pyyaml": check_pyyaml,
+        "optional": lambda: check_optional_tools(use_cache),
+    }
+    with ThreadPoolExecutor(max_workers=len(check_fns)) as executor:
+        futures = {name: executor.submit(fn) for name, fn in check_fns.items()}
+    optional = futures["optional"].result()
+
     # Required tools
-    available, version, error = check_python3()
+    available, version, error = futures["python3"].result()
     checks["python3"] = {
         "available": available,
         "version": version,
@@ -149,7 +395,7 @@ def check_all_prerequisites() -> dict:
         "install_cmd": "Pre-installed on macOS (or install via brew install python)"
     }
 
-    available, version, error = check_pyyaml()
+    available, version, error = futures["pyyaml"].result()
     checks["pyyaml"] = {
         "available": available,
         "version": version,
@@ -159,7 +405,7 @@ def check_all_prerequisites() -> dict:
     }
 
     # Optional tools
-    available, version, error = check_homebrew()
+    available, version, error = optional["homebrew"]
     checks["homebrew"] = {
         "available": available,
         "version": version,
@@ -168,7 +414,7 @@ def check_all_prerequisites() -> dict:
         "install_cmd": '/bin/bash -c "$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)"'
     }
 
-    available, version, error = check_mas()
+    available, version, error = optional["mas"]
     checks["mas"] = {
         "available": available,
         "version": version,
@@ -255,9 +501,14 @@ if __name__ == "__main__":
         action="store_true",
         help="Output results as JSON for machine parsing"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-run every check instead of reusing cached results"
+    )
 
     args = parser.parse_args()
-    results = check_all_prerequisites()
+    results = check_all_prerequisites(use_cache=not args.no_cache)
 
     if args.json:
         # Clean up None values for JSON output
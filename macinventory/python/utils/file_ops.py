@@ -11,39 +11,116 @@ From Vision document section "Platform-Specific File Attribute Handling":
     attributes, logging when special attributes are encountered.
 """
 
-import platform
-import subprocess
+import functools
+import os
+import re
+import stat
 from pathlib import Path
-from typing import Optional
-
-
+from typing import Iterable, Iterator, Optional
+
+# st_flags bits and the names ``ls -lO`` prints for them, in ls's order.
+# SF_RESTRICTED (SIP-protected) has no constant in the stat module.
+_SF_RESTRICTED = 0x00080000
+_FILE_FLAG_NAMES = (
+    (stat.SF_ARCHIVED, "arch"),
+    (stat.UF_OPAQUE, "opaque"),
+    (stat.UF_NODUMP, "nodump"),
+    (stat.SF_APPEND, "sappnd"),
+    (stat.SF_IMMUTABLE, "schg"),
+    (stat.SF_NOUNLINK, "sunlnk"),
+    (_SF_RESTRICTED, "restricted"),
+    (stat.UF_APPEND, "uappnd"),
+    (stat.UF_IMMUTABLE, "uchg"),
+    (stat.UF_HIDDEN, "hidden"),
+    (stat.UF_COMPRESSED, "compressed"),
+)
+
+# Below this many files a thread pool costs more than it saves
+_PARALLEL_CHMOD_MIN_FILES = 64
+
+# Worker count for thread pools doing per-file syscalls
+_MAX_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# An ACL entry line in ``ls -le`` output, e.g. " 0: group:everyone deny delete"
+_ACL_LINE_RE = re.compile(r"(?m)^\s*\d+:\s")
+
+_FIND_PATH = "/usr/bin/find"
+_CHMOD_PATH = "/bin/chmod"
+
+# acl_type_t for the extended (NFSv4-style) ACLs macOS uses, from <sys/acl.h>
+_ACL_TYPE_EXTENDED = 0x00000100
+
+
+@functools.lru_cache(maxsize=1)
 def is_macos() -> bool:
     """Check if running on macOS.
 
+    The platform can't change while running, so the answer is computed once.
+
     Returns:
         True if running on Darwin/macOS
     """
+    import platform
+
     return platform.system() == "Darwin"
 
 
-def remove_acl(filepath: Path) -> bool:
-    """Remove Access Control Lists from a file/directory (macOS only).
+def _iter_tree(filepath: Path) -> Iterator[str]:
+    """Yield a path and, if it is a directory, everything beneath it.
 
-    ACLs are extended permissions beyond standard Unix permissions.
-    Configuration files from system applications often have ACLs set
-    that can prevent normal copy operations.
+    Symlinks are yielded but never followed.
+
+    Args:
+        filepath: Path to file or directory
 
-    Uses: chmod -N <path> (without -R for single file, -R for directories)
+    Yields:
+        Path strings, starting with filepath itself
+    """
+    yield str(filepath)
+    if filepath.is_dir() and not filepath.is_symlink():
+        for root, dirs, files in os.walk(filepath):
+            for name in dirs:
+                yield os.path.join(root, name)
+            for name in files:
+                yield os.path.join(root, name)
+
+
+@functools.lru_cache(maxsize=1)
+def _acl_functions():
+    """Load the libSystem functions used to strip ACLs.
+
+    Returns:
+        Tuple of (acl_init, acl_set_link_np, acl_free) ctypes functions,
+        or None if they can't be loaded
+    """
+    try:
+        import ctypes
+
+        libc = ctypes.CDLL("/usr/lib/libSystem.B.dylib", use_errno=True)
+        acl_init = libc.acl_init
+        acl_init.argtypes = [ctypes.c_int]
+        acl_init.restype = ctypes.c_void_p
+        acl_set_link_np = libc.acl_set_link_np
+        acl_set_link_np.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p]
+        acl_set_link_np.restype = ctypes.c_int
+        acl_free = libc.acl_free
+        acl_free.argtypes = [ctypes.c_void_p]
+        acl_free.restype = ctypes.c_int
+    except (ImportError, OSError, AttributeError):
+        return None
+    return acl_init, acl_set_link_np, acl_free
+
+
+def _remove_acl_with_chmod(filepath: Path) -> bool:
+    """Remove ACLs by running chmod -N (fallback when libSystem isn't usable).
 
     Args:
         filepath: Path to file or directory
 
     Returns:
-        True if successful, ACLs removed, or not applicable
-        False if operation failed
+        True if chmod ran or isn't available, False if it couldn't be run
     """
-    if not is_macos():
-        return True
+    import subprocess
 
     chmod_path = Path("/bin/chmod")
     if not chmod_path.exists():
@@ -66,6 +143,45 @@ def remove_acl(filepath: Path) -> bool:
         return False
 
 
+def remove_acl(filepath: Path) -> bool:
+    """Remove Access Control Lists from a file/directory (macOS only).
+
+    ACLs are extended permissions beyond standard Unix permissions.
+    Configuration files from system applications often have ACLs set
+    that can prevent normal copy operations.
+
+    Sets an empty ACL on the path (and everything under a directory) via
+    libSystem's acl_set_link_np, the same thing chmod -N does, without
+    spawning chmod. Falls back to chmod -N if libSystem can't be loaded.
+
+    Args:
+        filepath: Path to file or directory
+
+    Returns:
+        True if successful, ACLs removed, or not applicable
+        False if operation failed
+    """
+    if not is_macos():
+        return True
+
+    functions = _acl_functions()
+    if functions is None:
+        return _remove_acl_with_chmod(filepath)
+    acl_init, acl_set_link_np, acl_free = functions
+
+    empty_acl = acl_init(0)
+    if not empty_acl:
+        return _remove_acl_with_chmod(filepath)
+
+    try:
+        for path in _iter_tree(filepath):
+            # Best effort, like chmod -N: failures on single entries are ignored
+            acl_set_link_np(os.fsencode(path), _ACL_TYPE_EXTENDED, empty_acl)
+    finally:
+        acl_free(empty_acl)
+    return True
+
+
 def remove_immutable_flags(filepath: Path) -> bool:
     """Remove immutable flags from a file/directory (macOS only).
 
@@ -73,108 +189,135 @@ def remove_immutable_flags(filepath: Path) -> bool:
     Only removes user-changeable flags (uchg), not system flags (schg)
     which require root permissions.
 
-    Uses: chflags nouchg <path> (without -R for single file, -R for directories)
+    Equivalent to chflags -R nouchg <path>, but clears UF_IMMUTABLE with
+    os.chflags directly, and only on entries that actually have it set.
 
     Args:
         filepath: Path to file or directory
 
     Returns:
-        True if successful, flags removed, or not applicable
-        False if operation failed
+        True (failures on individual entries are ignored, as with chflags)
     """
     if not is_macos():
         return True
 
-    chflags_path = Path("/usr/bin/chflags")
-    if not chflags_path.exists():
-        return True
+    for path in _iter_tree(filepath):
+        try:
+            st = os.lstat(path)
+            if st.st_flags & stat.UF_IMMUTABLE:
+                os.chflags(path, st.st_flags & ~stat.UF_IMMUTABLE, follow_symlinks=False)
+        except OSError:
+            pass  # Best effort, like chflags: skip entries we can't change
+    return True
 
-    try:
-        cmd = [str(chflags_path), "nouchg", str(filepath)]
-        if filepath.is_dir():
-            cmd.insert(1, "-R")
 
-        subprocess.run(
-            cmd,
+def _flag_names(st_flags: int) -> Optional[str]:
+    """Format st_flags the way ``ls -lO`` does (e.g. "uchg,hidden").
+
+    Args:
+        st_flags: The st_flags field of a stat result
+
+    Returns:
+        Comma-separated flag names, or None if no known flags are set
+    """
+    names = [name for bit, name in _FILE_FLAG_NAMES if st_flags & bit]
+    return ",".join(names) if names else None
+
+
+@functools.lru_cache(maxsize=256)
+def _ls_has_acl(path: str, ctime_ns: int) -> bool:
+    """Run ``ls -lde`` on a path and check it for ACL entries.
+
+    ACLs aren't visible through the stat or xattr APIs Python exposes on
+    macOS, so this still needs ls. ctime_ns only serves as part of the cache
+    key: changing a file's ACL updates its ctime, so stale results are never
+    returned.
+
+    Args:
+        path: Path to file or directory
+        ctime_ns: The path's st_ctime_ns
+
+    Returns:
+        True if the path has ACL entries
+    """
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            ["/bin/ls", "-lde", path],
             capture_output=True,
+            text=True,
             check=False,
             timeout=5  # Quick local operation
         )
-        return True
     except (OSError, subprocess.SubprocessError, subprocess.TimeoutExpired):
         return False
 
+    if result.returncode != 0:
+        return False
+
+    # ACLs show as additional lines starting with a number; skip the
+    # first line (the file entry itself) and scan the rest in one pass
+    output = result.stdout
+    return _ACL_LINE_RE.search(output, output.find('\n') + 1) is not None
+
+
+def _stat_macos_attrs(filepath: Path) -> tuple[Optional[str], bool]:
+    """Get a file's flags and ACL state from a single lstat.
+
+    Flags come straight from st_flags; only the ACL check runs ls, with
+    -d so a directory reports itself rather than its contents.
+
+    Args:
+        filepath: Path to file or directory
+
+    Returns:
+        Tuple of (flags, has_acl); flags is None if no flags are set
+    """
+    try:
+        st = os.lstat(filepath)
+    except OSError:
+        return None, False
+    flags = _flag_names(getattr(st, "st_flags", 0))
+    return flags, _ls_has_acl(str(filepath), st.st_ctime_ns)
+
 
 def get_file_flags(filepath: Path) -> Optional[str]:
     """Get file flags information (macOS only).
 
-    Uses: ls -lO <path>
-
     Args:
         filepath: Path to file
 
     Returns:
         Flags string (e.g., "uchg") or None if no flags or not macOS
     """
-    if not is_macos() or not filepath.exists():
+    if not is_macos():
         return None
 
     try:
-        result = subprocess.run(
-            ["/bin/ls", "-lO", str(filepath)],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=5  # Quick local operation
-        )
-        if result.returncode == 0:
-            # Output format: -rw-r--r--@ 1 user staff flags size date name
-            parts = result.stdout.split()
-            if len(parts) > 4:
-                # The flags appear in the 5th column
-                flags = parts[4]
-                # Common flags: uchg, hidden, restricted, compressed
-                if flags not in ['-', '']:
-                    return flags
-    except (OSError, subprocess.SubprocessError, subprocess.TimeoutExpired):
-        pass
-
-    return None
+        st = os.lstat(filepath)
+    except OSError:
+        return None
+    return _flag_names(getattr(st, "st_flags", 0))
 
 
 def has_acl(filepath: Path) -> bool:
     """Check if a file has ACLs (macOS only).
 
-    Uses: ls -le <path> and checks for ACL entries
-
     Args:
         filepath: Path to file
 
     Returns:
         True if file has ACLs, False otherwise
     """
-    if not is_macos() or not filepath.exists():
+    if not is_macos():
         return False
 
     try:
-        result = subprocess.run(
-            ["/bin/ls", "-le", str(filepath)],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=5  # Quick local operation
-        )
-        if result.returncode == 0:
-            # ACLs show as additional lines starting with a number
-            lines = result.stdout.strip().split('\n')
-            return len(lines) > 1 and any(
-                line.strip().startswith(('0:', '1:', '2:', '3:'))
-                for line in lines[1:]
-            )
-    except (OSError, subprocess.SubprocessError, subprocess.TimeoutExpired):
-        pass
-
-    return False
+        st = os.lstat(filepath)
+    except OSError:
+        return False
+    return _ls_has_acl(str(filepath), st.st_ctime_ns)
 
 
 def prepare_for_copy(filepath: Path) -> dict:
@@ -211,8 +354,7 @@ def prepare_for_copy(filepath: Path) -> dict:
         return result
 
     # Check current state
-    result['had_acl'] = has_acl(filepath)
-    result['original_flags'] = get_file_flags(filepath)
+    result['original_flags'], result['had_acl'] = _stat_macos_attrs(filepath)
 
     # Note: We typically don't want to modify the source file's attributes
     # The caller should handle this appropriately based on whether they
@@ -221,11 +363,199 @@ def prepare_for_copy(filepath: Path) -> dict:
     return result
 
 
+def _scandir_tree(directory: str) -> Iterator[os.DirEntry]:
+    """Yield every entry below a directory, depth first.
+
+    Each directory entry is yielded before its contents are listed, so the
+    caller can fix its permissions first. Symlinked directories are yielded
+    but not descended into.
+
+    Args:
+        directory: Directory to walk
+
+    Yields:
+        os.DirEntry for each file, directory and symlink below directory
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)  # Don't hold the fd open while recursing
+    except OSError:
+        return
+
+    for entry in entries:
+        yield entry
+        if entry.is_dir(follow_symlinks=False):
+            yield from _scandir_tree(entry.path)
+
+
+def _safe_chmod(path: str, mode: int) -> None:
+    """chmod a path, ignoring errors (permission normalization is best effort)."""
+    try:
+        os.chmod(path, mode)
+    except OSError:
+        pass
+
+
+def _chmod_tree_with_find(target: Path, file_mode: int, dir_mode: int) -> bool:
+    """Set modes on a whole tree with two find -exec chmod {} + runs.
+
+    find batches many paths into each chmod exec, so the whole tree costs
+    a handful of processes however many entries it has. Directories go
+    first so that unreadable ones are traversable for the file pass.
+    Symlinks are left alone.
+
+    Args:
+        target: Directory to normalize
+        file_mode: Permission mode for files
+        dir_mode: Permission mode for directories
+
+    Returns:
+        True if both passes succeeded; False means the caller should fall
+        back to walking the tree itself
+    """
+    import subprocess
+
+    if not (os.path.exists(_FIND_PATH) and os.path.exists(_CHMOD_PATH)):
+        return False
+
+    # Absolute, so a name starting with "-" can't be taken for an option
+    root = os.path.abspath(target)
+    try:
+        for entry_type, mode in (("d", dir_mode), ("f", file_mode)):
+            result = subprocess.run(
+                [_FIND_PATH, root, "-type", entry_type,
+                 "-exec", _CHMOD_PATH, format(mode, "o"), "{}", "+"],
+                capture_output=True,
+                check=False,
+                timeout=60
+            )
+            if result.returncode != 0:
+                return False
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return True
+
+
+def finalize_destination(
+    target: Path,
+    file_mode: int = 0o600,
+    dir_mode: int = 0o700,
+    clear_attributes: bool = True,
+    normalize: bool = True,
+) -> dict:
+    """Clear special attributes and normalize permissions on a copied destination.
+
+    Does the work of clear_destination_attributes() and
+    normalize_destination_permissions() in a single walk of the tree: each
+    entry has its uchg flag cleared, its ACL emptied and its mode set before
+    moving on, instead of walking the tree once per step.
+
+    Args:
+        target: Path to the copied file or directory
+        file_mode: Permission mode for files (default: 0o600)
+        dir_mode: Permission mode for directories (default: 0o700)
+        clear_attributes: Clear ACLs and immutable flags (macOS only)
+        normalize: Set file_mode/dir_mode on every entry
+
+    Returns:
+        Dictionary with results of attribute clearing
+    """
+    result = {
+        'path': str(target),
+        'acl_removed': False,
+        'flags_removed': False,
+    }
+
+    if not target.exists():
+        return result
+
+    clear_attributes = clear_attributes and is_macos()
+
+    # Permissions alone on a real directory: let find batch the chmods
+    if (
+        normalize
+        and not clear_attributes
+        and target.is_dir()
+        and not target.is_symlink()
+        and _chmod_tree_with_find(target, file_mode, dir_mode)
+    ):
+        return result
+
+    set_acl = None
+    empty_acl = None
+    if clear_attributes:
+        functions = _acl_functions()
+        if functions is not None:
+            acl_init, set_acl, acl_free = functions
+            empty_acl = acl_init(0)
+
+    chflags_failed = False
+
+    def finalize(path: str, mode: Optional[int]) -> None:
+        nonlocal chflags_failed
+        # Flags first: a uchg entry refuses ACL and mode changes
+        if clear_attributes:
+            try:
+                st = os.lstat(path)
+            except OSError:
+                st = None  # Vanished or unreadable: nothing to clear
+            if st is not None and st.st_flags & stat.UF_IMMUTABLE:
+                try:
+                    os.chflags(path, st.st_flags & ~stat.UF_IMMUTABLE, follow_symlinks=False)
+                except OSError:
+                    chflags_failed = True  # Keep going, like chflags -R
+        if empty_acl:
+            set_acl(os.fsencode(path), _ACL_TYPE_EXTENDED, empty_acl)
+        if mode is not None:
+            _safe_chmod(path, mode)
+
+    try:
+        is_dir = target.is_dir()
+        finalize(str(target), (dir_mode if is_dir else file_mode) if normalize else None)
+
+        if is_dir:
+            # Directories are finalized during the walk so unreadable ones
+            # become traversable before they are descended into; files are
+            # collected and finalized afterwards, in parallel for large trees.
+            file_paths = []
+            for entry in _scandir_tree(str(target)):
+                if entry.is_dir():
+                    finalize(entry.path, dir_mode if normalize else None)
+                else:
+                    file_paths.append(entry.path)
+
+            file_mode_or_none = file_mode if normalize else None
+            if len(file_paths) < _PARALLEL_CHMOD_MIN_FILES:
+                for path in file_paths:
+                    finalize(path, file_mode_or_none)
+            else:
+                from concurrent.futures import ThreadPoolExecutor
+
+                with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+                    for path in file_paths:
+                        executor.submit(finalize, path, file_mode_or_none)
+    finally:
+        if empty_acl:
+            acl_free(empty_acl)
+
+    if clear_attributes:
+        if empty_acl:
+            result['acl_removed'] = True
+        else:
+            # libSystem unusable: strip ACLs for the whole tree with chmod -N,
+            # now that the walk has cleared the uchg flags that would block it
+            result['acl_removed'] = _remove_acl_with_chmod(target)
+        result['flags_removed'] = not chflags_failed
+
+    return result
+
+
 def normalize_destination_permissions(target: Path, file_mode: int = 0o600, dir_mode: int = 0o700) -> None:
     """Normalize permissions on a copied config destination.
 
     After copying configuration files, normalize permissions to ensure
     backed-up configs are secure regardless of original permissions.
+    Use finalize_destination() to also clear attributes in the same pass.
 
     From Vision document:
         Files: 0600 (owner read/write only)
@@ -236,41 +566,15 @@ def normalize_destination_permissions(target: Path, file_mode: int = 0o600, dir_
         file_mode: Permission mode for files (default: 0o600)
         dir_mode: Permission mode for directories (default: 0o700)
     """
-    import os
-
-    if not target.exists():
-        return
-
-    if target.is_file():
-        try:
-            os.chmod(target, file_mode)
-        except OSError:
-            pass  # Best effort, don't fail on permission errors
-    elif target.is_dir():
-        try:
-            os.chmod(target, dir_mode)
-        except OSError:
-            pass
-
-        # Recursively normalize directory contents
-        for root, dirs, files in os.walk(target):
-            for d in dirs:
-                try:
-                    os.chmod(Path(root) / d, dir_mode)
-                except OSError:
-                    pass
-            for f in files:
-                try:
-                    os.chmod(Path(root) / f, file_mode)
-                except OSError:
-                    pass
+    finalize_destination(target, file_mode, dir_mode, clear_attributes=False)
 
 
 def clear_destination_attributes(target: Path) -> dict:
     """Clear special attributes from a copied destination.
 
     After copying a file, clear any inherited special attributes
-    to ensure the backup is clean and portable.
+    to ensure the backup is clean and portable. Use finalize_destination()
+    to also normalize permissions in the same pass.
 
     Args:
         target: Path to the copied destination
@@ -278,22 +582,30 @@ def clear_destination_attributes(target: Path) -> dict:
     Returns:
         Dictionary with results of attribute clearing
     """
-    result = {
-        'path': str(target),
-        'acl_removed': False,
-        'flags_removed': False,
-    }
+    return finalize_destination(target, normalize=False)
 
-    if not is_macos() or not target.exists():
-        return result
 
-    # Remove ACLs from destination
-    result['acl_removed'] = remove_acl(target)
+def bulk_clear_attributes(paths: Iterable[Path]) -> list[dict]:
+    """Clear special attributes from many copied destinations at once.
 
-    # Remove immutable flags from destination
-    result['flags_removed'] = remove_immutable_flags(target)
+    Runs clear_destination_attributes() for each path on a thread pool, so
+    the per-file syscalls (or chmod -N fallbacks) overlap instead of running
+    one after another.
 
-    return result
+    Args:
+        paths: Paths to copied destinations
+
+    Returns:
+        List of clear_destination_attributes() results, in input order
+    """
+    paths = list(paths)
+    if not is_macos() or len(paths) < 2:
+        return [clear_destination_attributes(path) for path in paths]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(paths))) as executor:
+        return list(executor.map(clear_destination_attributes, paths))
 
 
 if __name__ == "__main__":
@@ -9,8 +9,17 @@ From REVIEW-FINDINGS.md Issue #2:
     the intended directory."
 """
 
+import os
+import re
 from pathlib import Path
-from typing import Union
+from typing import Iterable, Union
+
+# Path parts that refer to a parent directory
+_PARENT_PARTS = frozenset({".."})
+
+# Everything sanitize_path_component() rewrites, matched in a single pass:
+# ".." is dropped, separators and spaces become hyphens
+_SANITIZE_RE = re.compile(r"\.\.|[/\\ ]")
 
 
 class PathTraversalError(ValueError):
@@ -43,6 +52,13 @@ def validate_relative_path(rel_path: Union[str, Path]) -> bool:
         >>> validate_relative_path("/etc/passwd")
         False
     """
+    if isinstance(rel_path, str):
+        # Fast path: the same checks on the string itself, without building
+        # a Path (POSIX rules, where "/" is the only separator)
+        if rel_path.startswith("/"):
+            return False
+        return _PARENT_PARTS.isdisjoint(rel_path.split("/"))
+
     path = Path(rel_path)
 
     # Reject absolute paths
@@ -50,7 +66,7 @@ def validate_relative_path(rel_path: Union[str, Path]) -> bool:
         return False
 
     # Reject paths with parent directory references
-    if ".." in path.parts:
+    if not _PARENT_PARTS.isdisjoint(path.parts):
         return False
 
     return True
@@ -87,15 +103,55 @@ def safe_join(base: Path, relative: Union[str, Path]) -> Path:
     if not validate_relative_path(relative):
         raise PathTraversalError(f"Invalid relative path: {relative}")
 
-    # Resolve both paths to catch edge cases
+    return _join_resolved(base, base.resolve(), relative)
+
+
+def safe_join_many(base: Path, relatives: Iterable[Union[str, Path]]) -> list[Path]:
+    """Join several relative paths onto one base with traversal protection.
+
+    Equivalent to calling safe_join() for each path, but resolves base
+    only once.
+
+    Args:
+        base: The base directory (must exist or be creatable)
+        relatives: The relative paths to join
+
+    Returns:
+        The resolved, safe destination paths, in input order
+
+    Raises:
+        PathTraversalError: If any resolved path escapes base directory
+    """
     base_resolved = base.resolve()
-    dest = (base / relative).resolve()
+    dests = []
+    for relative in relatives:
+        if not validate_relative_path(relative):
+            raise PathTraversalError(f"Invalid relative path: {relative}")
+        dests.append(_join_resolved(base, base_resolved, relative))
+    return dests
 
-    # Verify the destination is still within the base directory
-    # Using is_relative_to() for Python 3.9+ compatibility
-    try:
-        dest.relative_to(base_resolved)
-    except ValueError:
+
+def _join_resolved(base: Path, base_resolved: Path, relative: Union[str, Path]) -> Path:
+    """Resolve relative under an already-resolved base and check containment.
+
+    Args:
+        base: The base directory as given (for error messages)
+        base_resolved: base.resolve()
+        relative: The (already validated) relative path to join
+
+    Returns:
+        The resolved destination path
+
+    Raises:
+        PathTraversalError: If the resolved path escapes base directory
+    """
+    # Resolve to catch edge cases such as symlinks pointing outside base
+    dest = (base_resolved / relative).resolve()
+
+    # Verify the destination is still within the base directory; comparing
+    # with commonpath avoids relative_to()'s exception on the happy path
+    base_str = str(base_resolved)
+    if os.path.commonpath([base_str, str(dest)]) != base_str:
         raise PathTraversalError(
             f"Path traversal detected: {relative} escapes {base}"
         )
@@ -103,6 +159,11 @@ def safe_join(base: Path, relative: Union[str, Path]) -> Path:
     return dest
 
 
+def _sanitize_replacement(match: re.Match) -> str:
+    """Replacement for _SANITIZE_RE: drop "..", hyphenate anything else."""
+    return "" if match.group() == ".." else "-"
+
+
 def sanitize_path_component(name: str) -> str:
     """Sanitize a single path component (filename or directory name).
 
@@ -123,14 +184,9 @@ def sanitize_path_component(name: str) -> str:
         >>> sanitize_path_component("app/config")
         'app-config'
     """
-    # Remove parent directory references
-    sanitized = name.replace("..", "")
-
-    # Replace path separators with hyphens
-    sanitized = sanitized.replace("/", "-").replace("\\", "-")
-
-    # Convert to lowercase and replace spaces
-    sanitized = sanitized.lower().replace(" ", "-")
+    # Remove parent directory references and replace path separators and
+    # spaces with hyphens, then lowercase
+    sanitized = _SANITIZE_RE.sub(_sanitize_replacement, name).lower()
 
     # Remove any leading/trailing hyphens or dots
     sanitized = sanitized.strip("-.")
@@ -13,10 +13,29 @@ macOS plist files can be in three formats:
 - JSON (supported but rarely used for config files)
 """
 
+import base64
+import fnmatch
+import functools
+import mmap
+import os
 import plistlib
+import re
+import shutil
 import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from types import SimpleNamespace
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
+
+# lxml is optional; with it, XML plists are parsed by libxml2 instead of
+# plistlib's expat handlers, which is noticeably faster for large files.
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
 
 
 class PlistError(Exception):
@@ -24,48 +43,95 @@ class PlistError(Exception):
     pass
 
 
+# plistlib.dump issues many small writes; a large buffer turns them into
+# a handful of write syscalls even for multi-megabyte plists
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Limits read_plist applies before parsing, to bound the work a hostile
+# plist can cause
+MAX_PLIST_DEPTH = 200
+MAX_PLIST_SIZE = 64 << 20
+
+# Opening, closing, and empty <dict>/<array> tags in an XML plist
+_CONTAINER_TAG_RE = re.compile(rb'<(/?)(?:dict|array)\s*(/?)>')
+
+# How an XML plist starts, once leading whitespace and any BOM are skipped
+_UTF8_BOM = b'\xef\xbb\xbf'
+_XML_PLIST_PREFIXES = (b'<?xml', b'<!DOCTYPE plist', b'<plist')
+
+
+def _read_head(file_path: Path, size: int = 100) -> bytes:
+    """Read the first bytes of a file with a single unbuffered read.
+
+    Skips the buffered file object (and its 8 KiB buffer) that open()
+    would set up just to look at a header.
+
+    Args:
+        file_path: Path to the file to read
+        size: Number of bytes to read
+
+    Returns:
+        Up to size bytes, or b'' if the file can't be read
+    """
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return b''
+    try:
+        return os.read(fd, size)
+    except OSError:
+        return b''
+    finally:
+        os.close(fd)
+
+
+def _sniff_plist_format(file_path: Path) -> Optional[str]:
+    """Detect a plist's format from a single read of its first bytes.
+
+    Binary plists start with the magic bytes 'bplist'. XML plists
+    typically start with '<?xml' or '<!DOCTYPE plist'.
+
+    Args:
+        file_path: Path to the file to check
+
+    Returns:
+        'binary', 'xml', or None if not a plist (or unreadable)
+    """
+    header = _read_head(file_path)
+
+    # Dispatch on the first byte so most non-plist files are rejected
+    # without any substring scans
+    if header[:1] == b'b':
+        return 'binary' if header[:6] == b'bplist' else None
+    # Check for XML declaration, DOCTYPE or root element, allowing for
+    # leading whitespace and a UTF-8 BOM
+    if header.lstrip().removeprefix(_UTF8_BOM).startswith(_XML_PLIST_PREFIXES):
+        return 'xml'
+    return None
+
+
 def is_binary_plist(file_path: Path) -> bool:
     """Check if a file is a binary plist.
 
-    Binary plists start with the magic bytes 'bplist'.
-
     Args:
         file_path: Path to the file to check
 
     Returns:
         True if file is a binary plist, False otherwise
     """
-    try:
-        with open(file_path, 'rb') as f:
-            magic = f.read(6)
-            return magic == b'bplist'
-    except (OSError, IOError):
-        return False
+    return _sniff_plist_format(file_path) == 'binary'
 
 
 def is_xml_plist(file_path: Path) -> bool:
     """Check if a file is an XML plist.
 
-    XML plists typically start with '<?xml' or '<!DOCTYPE plist'.
-
     Args:
         file_path: Path to the file to check
 
     Returns:
         True if file appears to be an XML plist, False otherwise
     """
-    try:
-        with open(file_path, 'rb') as f:
-            # Read first 100 bytes for magic detection
-            header = f.read(100)
-            # Check for XML declaration or DOCTYPE
-            return (
-                header.startswith(b'<?xml') or
-                b'<!DOCTYPE plist' in header or
-                b'<plist' in header
-            )
-    except (OSError, IOError):
-        return False
+    return _sniff_plist_format(file_path) == 'xml'
 
 
 def is_plist(file_path: Path) -> bool:
@@ -77,7 +143,7 @@ def is_plist(file_path: Path) -> bool:
     Returns:
         True if file is a plist, False otherwise
     """
-    return is_binary_plist(file_path) or is_xml_plist(file_path)
+    return _sniff_plist_format(file_path) is not None
 
 
 def get_plist_format(file_path: Path) -> Optional[str]:
@@ -89,11 +155,51 @@ def get_plist_format(file_path: Path) -> Optional[str]:
     Returns:
         'binary', 'xml', or None if not a plist
     """
-    if is_binary_plist(file_path):
-        return 'binary'
-    elif is_xml_plist(file_path):
-        return 'xml'
-    return None
+    return _sniff_plist_format(file_path)
+
+
+@functools.lru_cache(maxsize=1)
+def _clonefile_function():
+    """Load libSystem's clonefile(2) for copy-on-write copies on APFS.
+
+    Returns:
+        ctypes clonefile function, or None if it can't be loaded
+    """
+    if sys.platform != 'darwin':
+        return None
+    try:
+        import ctypes
+
+        libc = ctypes.CDLL("/usr/lib/libSystem.B.dylib", use_errno=True)
+        clonefile = libc.clonefile
+        clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32]
+        clonefile.restype = ctypes.c_int
+    except (ImportError, OSError, AttributeError):
+        return None
+    return clonefile
+
+
+def _fast_copy(source: Path, dest: Path) -> None:
+    """Copy a file with its metadata, cloning it where the filesystem allows.
+
+    On APFS, clonefile(2) creates a copy-on-write clone without copying any
+    data. Anywhere else, or when cloning fails (e.g. dest already exists or
+    is on another volume), this falls back to shutil.copy2, which already
+    uses the platform's in-kernel copy where one exists.
+
+    Args:
+        source: File to copy
+        dest: Destination file path
+    """
+    clonefile = _clonefile_function()
+    if clonefile is not None and clonefile(os.fsencode(source), os.fsencode(dest), 0) == 0:
+        return
+    shutil.copy2(source, dest)
+
+
+# Caps how many per-file plutil processes run at once when conversions
+# are spread over PlistConverter's thread pool
+_PLUTIL_SLOTS = threading.BoundedSemaphore((os.cpu_count() or 4) * 2)
 
 
 def convert_to_xml_plutil(
@@ -119,22 +225,25 @@ def convert_to_xml_plutil(
         # Convert to destination
         dest.parent.mkdir(parents=True, exist_ok=True)
         # First copy, then convert
-        import shutil
-        shutil.copy2(source, dest)
+        _fast_copy(source, dest)
         cmd = ['/usr/bin/plutil', '-convert', 'xml1', str(dest)]
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        with _PLUTIL_SLOTS:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                timeout=30
+            )
 
         if result.returncode == 0:
             return True, "Converted successfully"
         else:
-            error_msg = result.stderr.strip() or result.stdout.strip() or "Unknown error"
+            # Output is only decoded when there's an error to report
+            error_msg = (
+                (result.stderr.strip() or result.stdout.strip()).decode('utf-8', 'replace')
+                or "Unknown error"
+            )
             return False, f"plutil error: {error_msg}"
 
     except subprocess.TimeoutExpired:
@@ -145,6 +254,46 @@ def convert_to_xml_plutil(
         return False, f"Unexpected error: {e}"
 
 
+# Maximum number of files handed to a single plutil invocation
+PLUTIL_BATCH_SIZE = 500
+
+
+def convert_batch_plutil(paths: list[Path]) -> set[Path]:
+    """Convert many plists to XML in place with as few plutil runs as possible.
+
+    plutil accepts any number of files, so this forks once per chunk of
+    PLUTIL_BATCH_SIZE paths instead of once per file. When a chunk fails,
+    the files plutil names in its error output ('file: error') are
+    reported; if none can be attributed, the whole chunk is.
+
+    Args:
+        paths: Plist files to convert in place
+
+    Returns:
+        Set of paths that were not converted
+    """
+    failed: set[Path] = set()
+
+    for start in range(0, len(paths), PLUTIL_BATCH_SIZE):
+        chunk = paths[start:start + PLUTIL_BATCH_SIZE]
+        try:
+            result = subprocess.run(
+                ['/usr/bin/plutil', '-convert', 'xml1', *map(str, chunk)],
+                capture_output=True,
+                timeout=max(30, 3 * len(chunk))
+            )
+        except (OSError, subprocess.SubprocessError):
+            failed.update(chunk)
+            continue
+
+        if result.returncode != 0:
+            output = (result.stderr + result.stdout).decode('utf-8', 'replace')
+            reported = {path for path in chunk if f"{path}:" in output}
+            failed.update(reported or chunk)
+
+    return failed
+
+
 def convert_to_xml_python(
     source: Path,
     dest: Optional[Path] = None
@@ -163,14 +312,16 @@ def convert_to_xml_python(
     """
     try:
         # Read the plist (works with both binary and XML)
-        with open(source, 'rb') as f:
-            data = plistlib.load(f)
+        data = _cf_load(source)
+        if data is None:
+            with open(source, 'rb') as f:
+                data = plistlib.load(f)
 
         # Write as XML
         output_path = dest or source
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'wb') as f:
+        with open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
             plistlib.dump(data, f, fmt=plistlib.FMT_XML)
 
         return True, "Converted successfully"
@@ -184,7 +335,8 @@ def convert_to_xml_python(
 def convert_to_xml(
     source: Path,
     dest: Optional[Path] = None,
-    use_plutil: bool = True
+    use_plutil: bool = True,
+    known_format: Optional[str] = None
 ) -> tuple[bool, str]:
     """Convert a plist file to XML format.
 
@@ -195,20 +347,27 @@ def convert_to_xml(
         source: Path to the source plist file
         dest: Optional destination path (in-place if None)
         use_plutil: Try plutil first if available
+        known_format: Format the caller already sniffed ('binary' or 'xml');
+            skips reading the header again
 
     Returns:
         Tuple of (success, message)
     """
+    plist_format = known_format or _sniff_plist_format(source)
+
+    # A destination that is the source itself means in-place conversion
+    if dest is not None and (dest == source or dest.resolve() == source.resolve()):
+        dest = None
+
     # Check if already XML
-    if is_xml_plist(source):
-        if dest and dest != source:
-            import shutil
+    if plist_format == 'xml':
+        if dest is not None:
             dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source, dest)
+            _fast_copy(source, dest)
         return True, "Already XML format"
 
     # Check if it's a plist at all
-    if not is_binary_plist(source):
+    if plist_format != 'binary':
         return False, "Not a valid plist file"
 
     # Try plutil first on macOS
@@ -222,29 +381,327 @@ def convert_to_xml(
     return convert_to_xml_python(source, dest)
 
 
-def read_plist(file_path: Path) -> dict[str, Any]:
+def read_plist(
+    file_path: Path,
+    max_depth: int = MAX_PLIST_DEPTH,
+    max_size: int = MAX_PLIST_SIZE
+) -> dict[str, Any]:
     """Read a plist file and return its contents as a dictionary.
 
     Handles both binary and XML plist formats.
 
+    As hardening against hostile files, plists larger than max_size bytes
+    are rejected before being read, and XML plists are scanned for their
+    container nesting depth before being handed to a (recursive) parser.
+
     Args:
         file_path: Path to the plist file
+        max_depth: Maximum <dict>/<array> nesting depth for XML plists
+        max_size: Maximum file size in bytes
 
     Returns:
         Dictionary with plist contents
 
     Raises:
-        PlistError: If file cannot be read or parsed
+        PlistError: If file cannot be read or parsed, or exceeds the limits
     """
     try:
+        size = os.stat(file_path).st_size
+        if size > max_size:
+            raise PlistError(f"Plist too large: {size} bytes (limit {max_size})")
+
+        plist_format = _sniff_plist_format(file_path)
+        if plist_format == 'binary':
+            data = _cf_load(file_path)
+            if data is not None:
+                return data
         with open(file_path, 'rb') as f:
-            return plistlib.load(f)
+            if size == 0:
+                # mmap can't map an empty file; let plistlib report it
+                return plistlib.load(f)
+            # Parse straight from the mapped pages instead of reading the
+            # whole file into a bytes object first
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if plist_format == 'xml':
+                    _check_nesting_depth(mapped, max_depth)
+                    if etree is not None:
+                        return _read_plist_lxml(mapped)
+                return plistlib.load(mapped)
+    except PlistError:
+        raise
     except plistlib.InvalidFileException as e:
         raise PlistError(f"Invalid plist format: {e}")
     except Exception as e:
         raise PlistError(f"Could not read plist: {e}")
 
 
+def _check_nesting_depth(data: bytes | mmap.mmap, max_depth: int) -> None:
+    """Reject an XML plist whose containers nest deeper than max_depth.
+
+    A single regex pass over the raw bytes tracks opening and closing
+    <dict>/<array> tags, so deeply nested input is refused before any
+    recursive parsing can exhaust the stack.
+
+    Args:
+        data: Contents of the XML plist file
+        max_depth: Maximum allowed nesting depth
+
+    Raises:
+        PlistError: If the nesting depth exceeds max_depth
+    """
+    depth = 0
+    for match in _CONTAINER_TAG_RE.finditer(data):
+        if match.group(1):
+            depth -= 1
+        elif not match.group(2):
+            depth += 1
+            if depth > max_depth:
+                raise PlistError(f"Plist nesting exceeds {max_depth} levels")
+
+
+def _read_plist_lxml(data: mmap.mmap) -> Any:
+    """Parse an XML plist with lxml, producing the same values as plistlib.
+
+    Entity resolution and network access are disabled so a hostile plist
+    cannot pull in external files or expand entities. Entity declarations
+    are rejected outright, as plistlib does, rather than leaving their
+    references silently unexpanded.
+
+    Args:
+        data: Mapped contents of the XML plist file
+
+    Returns:
+        The plist's top-level value (normally a dictionary)
+
+    Raises:
+        ValueError: If the document is not a well-formed plist
+    """
+    parser = etree.XMLParser(
+        resolve_entities=False,
+        no_network=True,
+        huge_tree=False,
+        remove_comments=True,
+        remove_pis=True,
+    )
+    tree = etree.parse(data, parser)
+    dtd = tree.docinfo.internalDTD
+    if dtd is not None and any(True for _ in dtd.iterentities()):
+        raise plistlib.InvalidFileException(
+            "XML entity declarations are not supported in plist files")
+    root = tree.getroot()
+    if root.tag != 'plist' or len(root) != 1:
+        raise ValueError("Missing or malformed <plist> root element")
+    return _lxml_plist_value(root[0])
+
+
+def _lxml_plist_value(element: Any) -> Any:
+    """Convert one plist value element to the matching Python value."""
+    tag = element.tag
+    if tag == 'dict':
+        result = {}
+        children = list(element)
+        if len(children) % 2:
+            raise ValueError("Unbalanced <dict> key/value pairs")
+        for key, value in zip(children[::2], children[1::2]):
+            if key.tag != 'key':
+                raise ValueError(f"Expected <key>, found <{key.tag}>")
+            result[key.text or ''] = _lxml_plist_value(value)
+        return result
+    if tag == 'array':
+        return [_lxml_plist_value(child) for child in element]
+    if tag == 'string':
+        return element.text or ''
+    if tag == 'integer':
+        text = (element.text or '').strip()
+        if text.lower().startswith(('0x', '-0x')):
+            return int(text, 16)
+        return int(text)
+    if tag == 'real':
+        return float(element.text)
+    if tag == 'true':
+        return True
+    if tag == 'false':
+        return False
+    if tag == 'data':
+        return base64.b64decode(''.join((element.text or '').split()))
+    if tag == 'date':
+        return datetime.strptime((element.text or '').strip(), '%Y-%m-%dT%H:%M:%SZ')
+    raise ValueError(f"Unsupported plist element <{tag}>")
+
+
+_CF_PATH = '/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation'
+_CF_STRING_ENCODING_UTF8 = 0x08000100
+_CF_NUMBER_SINT64 = 4
+_CF_NUMBER_FLOAT64 = 6
+# CFDate values are seconds relative to this reference date (UTC)
+_CF_EPOCH = datetime(2001, 1, 1)
+
+
+@functools.lru_cache(maxsize=1)
+def _cf_functions() -> Optional[SimpleNamespace]:
+    """Load the CoreFoundation functions used to parse plists.
+
+    Returns:
+        Namespace of ctypes functions and type IDs, or None if
+        CoreFoundation isn't available (e.g. not on macOS)
+    """
+    if sys.platform != 'darwin':
+        return None
+
+    try:
+        import ctypes
+
+        cf = ctypes.CDLL(_CF_PATH)
+
+        class CFRange(ctypes.Structure):
+            _fields_ = [('location', ctypes.c_long), ('length', ctypes.c_long)]
+
+        ref, index, type_id = ctypes.c_void_p, ctypes.c_long, ctypes.c_ulong
+        boolean, encoding = ctypes.c_ubyte, ctypes.c_uint32
+        signatures = {
+            'CFDataCreateWithBytesNoCopy': (ref, [ref, ctypes.c_char_p, index, ref]),
+            'CFPropertyListCreateWithData': (ref, [ref, ref, ctypes.c_ulong, ref, ref]),
+            'CFRelease': (None, [ref]),
+            'CFGetTypeID': (type_id, [ref]),
+            'CFDictionaryGetTypeID': (type_id, []),
+            'CFArrayGetTypeID': (type_id, []),
+            'CFStringGetTypeID': (type_id, []),
+            'CFNumberGetTypeID': (type_id, []),
+            'CFBooleanGetTypeID': (type_id, []),
+            'CFDataGetTypeID': (type_id, []),
+            'CFDateGetTypeID': (type_id, []),
+            'CFDictionaryGetCount': (index, [ref]),
+            'CFDictionaryGetKeysAndValues': (None, [ref, ref, ref]),
+            'CFArrayGetCount': (index, [ref]),
+            'CFArrayGetValueAtIndex': (ref, [ref, index]),
+            'CFStringGetLength': (index, [ref]),
+            'CFStringGetMaximumSizeForEncoding': (index, [index, encoding]),
+            'CFStringGetBytes': (index, [ref, CFRange, encoding, ctypes.c_ubyte,
+                                         boolean, ctypes.c_char_p, index,
+                                         ctypes.POINTER(index)]),
+            'CFNumberIsFloatType': (boolean, [ref]),
+            'CFNumberGetValue': (boolean, [ref, index, ref]),
+            'CFBooleanGetValue': (boolean, [ref]),
+            'CFDataGetLength': (index, [ref]),
+            'CFDataGetBytePtr': (ref, [ref]),
+            'CFDateGetAbsoluteTime': (ctypes.c_double, [ref]),
+        }
+        functions = {}
+        for name, (restype, argtypes) in signatures.items():
+            function = getattr(cf, name)
+            function.restype = restype
+            function.argtypes = argtypes
+            functions[name] = function
+        allocator_null = ref.in_dll(cf, 'kCFAllocatorNull')
+    except (ImportError, OSError, AttributeError, ValueError):
+        return None
+
+    return SimpleNamespace(
+        ctypes=ctypes,
+        CFRange=CFRange,
+        allocator_null=allocator_null,
+        dict_type=functions['CFDictionaryGetTypeID'](),
+        array_type=functions['CFArrayGetTypeID'](),
+        string_type=functions['CFStringGetTypeID'](),
+        number_type=functions['CFNumberGetTypeID'](),
+        boolean_type=functions['CFBooleanGetTypeID'](),
+        data_type=functions['CFDataGetTypeID'](),
+        date_type=functions['CFDateGetTypeID'](),
+        **functions,
+    )
+
+
+def _cf_load(file_path: Path) -> Any:
+    """Parse a plist with CoreFoundation instead of plistlib.
+
+    The file's bytes are handed to CFPropertyListCreateWithData without
+    copying and the result is converted to the same Python values
+    plistlib produces.
+
+    Args:
+        file_path: Path to the plist file
+
+    Returns:
+        The plist's top-level value, or None if CoreFoundation isn't
+        available or couldn't convert the file (callers then use plistlib,
+        which also produces the error message)
+    """
+    cf = _cf_functions()
+    if cf is None:
+        return None
+
+    try:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+    except OSError:
+        return None
+
+    data_ref = cf.CFDataCreateWithBytesNoCopy(None, raw, len(raw), cf.allocator_null)
+    if not data_ref:
+        return None
+    try:
+        plist_ref = cf.CFPropertyListCreateWithData(None, data_ref, 0, None, None)
+        if not plist_ref:
+            return None
+        try:
+            return _cf_to_python(cf, plist_ref)
+        except ValueError:
+            return None
+        finally:
+            cf.CFRelease(plist_ref)
+    finally:
+        cf.CFRelease(data_ref)
+
+
+def _cf_to_python(cf: SimpleNamespace, ref: int) -> Any:
+    """Convert one CoreFoundation property list object to a Python value."""
+    ctypes = cf.ctypes
+    type_id = cf.CFGetTypeID(ref)
+
+    if type_id == cf.dict_type:
+        count = cf.CFDictionaryGetCount(ref)
+        keys = (ctypes.c_void_p * count)()
+        values = (ctypes.c_void_p * count)()
+        cf.CFDictionaryGetKeysAndValues(ref, keys, values)
+        return {
+            _cf_to_python(cf, key): _cf_to_python(cf, value)
+            for key, value in zip(keys, values)
+        }
+    if type_id == cf.array_type:
+        return [
+            _cf_to_python(cf, cf.CFArrayGetValueAtIndex(ref, i))
+            for i in range(cf.CFArrayGetCount(ref))
+        ]
+    if type_id == cf.string_type:
+        length = cf.CFStringGetLength(ref)
+        size = cf.CFStringGetMaximumSizeForEncoding(length, _CF_STRING_ENCODING_UTF8)
+        buffer = ctypes.create_string_buffer(size)
+        used = ctypes.c_long(0)
+        cf.CFStringGetBytes(ref, cf.CFRange(0, length), _CF_STRING_ENCODING_UTF8,
+                            0, 0, buffer, size, ctypes.byref(used))
+        return buffer.raw[:used.value].decode('utf-8')
+    if type_id == cf.boolean_type:
+        return bool(cf.CFBooleanGetValue(ref))
+    if type_id == cf.number_type:
+        if cf.CFNumberIsFloatType(ref):
+            value = ctypes.c_double()
+            number_type = _CF_NUMBER_FLOAT64
+        else:
+            value = ctypes.c_int64()
+            number_type = _CF_NUMBER_SINT64
+        if not cf.CFNumberGetValue(ref, number_type, ctypes.byref(value)):
+            # Out of range for a signed 64-bit integer; let plistlib decode it
+            raise ValueError("Number not representable")
+        return value.value
+    if type_id == cf.data_type:
+        length = cf.CFDataGetLength(ref)
+        return ctypes.string_at(cf.CFDataGetBytePtr(ref), length) if length else b''
+    if type_id == cf.date_type:
+        return _CF_EPOCH + timedelta(seconds=cf.CFDateGetAbsoluteTime(ref))
+    # Anything else (e.g. keyed-archiver UIDs) is left to plistlib
+    raise ValueError(f"Unsupported CoreFoundation type {type_id}")
+
+
 def read_plist_safe(file_path: Path) -> tuple[Optional[dict], Optional[str]]:
     """Safely read a plist file, returning error instead of raising.
 
@@ -275,13 +732,44 @@ def write_plist_xml(data: dict[str, Any], file_path: Path) -> tuple[bool, str]:
     """
     try:
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(file_path, 'wb') as f:
+        with open(file_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
             plistlib.dump(data, f, fmt=plistlib.FMT_XML)
         return True, "Written successfully"
     except Exception as e:
         return False, f"Write error: {e}"
 
 
+def _iter_matching_files(dir_path: Path, pattern: str) -> Iterator[Path]:
+    """Yield files directly inside a directory whose names match a glob pattern.
+
+    Reads the directory with a single os.scandir pass and matches on the
+    raw entry names, so non-matching entries never cost a stat or a Path.
+    Simple '*suffix' patterns such as '*.plist' are matched with endswith.
+
+    Args:
+        dir_path: Directory to scan
+        pattern: Single-level glob pattern (no '/')
+
+    Yields:
+        Paths of matching regular files (symlinks to files included)
+    """
+    if pattern.startswith('*') and not any(c in pattern[1:] for c in '*?['):
+        suffix = pattern[1:]
+        matches = lambda name: name.endswith(suffix)
+    else:
+        matches = re.compile(fnmatch.translate(pattern)).match
+
+    try:
+        entries = os.scandir(dir_path)
+    except OSError:
+        return
+
+    with entries:
+        for entry in entries:
+            if matches(entry.name) and entry.is_file():
+                yield dir_path / entry.name
+
+
 class PlistConverter:
     """Batch plist conversion utility.
 
@@ -297,7 +785,8 @@ class PlistConverter:
 
     def __init__(self):
         """Initialize the converter."""
-        self.files: list[Path] = []
+        # (path, format) pairs; the format is sniffed once in add_file()
+        self.files: list[tuple[Path, str]] = []
         self.results: list[dict[str, Any]] = []
 
     def add_file(self, file_path: Path) -> bool:
@@ -310,8 +799,9 @@ class PlistConverter:
             True if file was added (is a valid plist)
         """
         path = Path(file_path).expanduser()
-        if path.exists() and is_plist(path):
-            self.files.append(path)
+        plist_format = _sniff_plist_format(path)
+        if plist_format is not None:
+            self.files.append((path, plist_format))
             return True
         return False
 
@@ -328,10 +818,15 @@ class PlistConverter:
         dir_path = Path(dir_path).expanduser()
         count = 0
 
-        if dir_path.exists():
-            for file_path in dir_path.glob(pattern):
-                if self.add_file(file_path):
-                    count += 1
+        if '/' in pattern or '**' in pattern:
+            # Multi-level patterns still need pathlib's recursive glob
+            file_paths = dir_path.glob(pattern) if dir_path.exists() else ()
+        else:
+            file_paths = _iter_matching_files(dir_path, pattern)
+
+        for file_path in file_paths:
+            if self.add_file(file_path):
+                count += 1
 
         return count
 
@@ -350,11 +845,12 @@ class PlistConverter:
             List of result dictionaries
         """
         self.results = []
+        jobs: list[tuple[Path, Optional[Path], str]] = []
 
-        for source in self.files:
+        for source, plist_format in self.files:
             result: dict[str, Any] = {
                 'source': str(source),
-                'original_format': get_plist_format(source),
+                'original_format': plist_format,
             }
 
             if output_dir:
@@ -373,12 +869,64 @@ class PlistConverter:
                 dest = None
                 result['dest'] = str(source)
 
-            success, message = convert_to_xml(source, dest)
-            result['success'] = success
-            result['message'] = message
-
+            jobs.append((source, dest, plist_format))
             self.results.append(result)
 
+        # Each conversion mostly waits on a plutil subprocess or file I/O,
+        # so run them concurrently. Jobs writing the same output file are
+        # kept together and run in order, so the last one still wins.
+        jobs_by_output: dict[Path, list[int]] = {}
+        for index, (source, dest, _) in enumerate(jobs):
+            jobs_by_output.setdefault(dest or source, []).append(index)
+
+        def run_jobs(indices: list[int]) -> None:
+            for index in indices:
+                source, dest, plist_format = jobs[index]
+                success, message = convert_to_xml(source, dest, known_format=plist_format)
+                self.results[index]['success'] = success
+                self.results[index]['message'] = message
+
+        def stage_copy(index: int) -> Optional[Path]:
+            source, dest, _ = jobs[index]
+            if dest is None:
+                return source
+            try:
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                _fast_copy(source, dest)
+            except OSError:
+                return None
+            return dest
+
+        max_workers = min(32, (os.cpu_count() or 4) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Binary plists that are the only job for their output file are
+            # converted with batched plutil runs; anything plutil rejects
+            # goes through the per-file path below.
+            batched: dict[Path, int] = {}
+            if os.path.exists('/usr/bin/plutil'):
+                candidates = [
+                    indices[0] for indices in jobs_by_output.values()
+                    if len(indices) == 1
+                    and self.results[indices[0]]['original_format'] == 'binary'
+                ]
+                for index, target in zip(candidates, executor.map(stage_copy, candidates)):
+                    if target is not None:
+                        batched[target] = index
+
+            if batched:
+                failed = convert_batch_plutil(list(batched))
+                for target, index in batched.items():
+                    if target not in failed:
+                        self.results[index]['success'] = True
+                        self.results[index]['message'] = "Converted successfully"
+
+            pending = [
+                indices for indices in jobs_by_output.values()
+                if 'success' not in self.results[indices[0]]
+            ]
+            for future in [executor.submit(run_jobs, indices) for indices in pending]:
+                future.result()
+
         return self.results
 
     def get_summary(self) -> dict[str, Any]:
@@ -452,7 +1000,6 @@ def backup_plist_as_xml(
 
         # Normalize permissions if requested
         if normalize_permissions:
-            import os
             try:
                 os.chmod(dest, 0o600)
             except OSError:
@@ -478,10 +1025,8 @@ if __name__ == "__main__":
 
         # Check format breakdown
         formats = {'binary': 0, 'xml': 0}
-        for f in converter.files[:20]:  # Check first 20
-            fmt = get_plist_format(f)
-            if fmt:
-                formats[fmt] += 1
+        for _, fmt in converter.files[:20]:  # Check first 20
+            formats[fmt] += 1
 
         print( "Format breakdown (first 20):")
         print(f"  Binary: {formats['binary']}")
@@ -18,6 +18,77 @@ from pathlib import Path
 from typing import Dict, List, Optional
 import base64
 import binascii
+import functools
+import os
+
+
+# Resolved once at import; every detector looks under the same home folder
+_HOME = Path.home()
+_CLOUD_STORAGE = _HOME / "Library/CloudStorage"
+_ICLOUD_PATH = _HOME / "Library/Mobile Documents/com~apple~CloudDocs"
+
+# Whether iCloud Drive exists, checked on first use; see invalidate_cache()
+_icloud_exists: Optional[bool] = None
+
+
+def invalidate_cache() -> None:
+    """Forget cached detection results so the next call checks the disk again.
+
+    Useful for long-running processes and tests that change the folders
+    being detected.
+    """
+    global _icloud_exists
+    _icloud_exists = None
+    get_cloud_storage_display_name.cache_clear()
+
+
+def _list_cloud_storage() -> List[str]:
+    """List entry names in ~/Library/CloudStorage with a single os.scandir pass.
+
+    Returns:
+        Entry names in directory order (empty if the folder doesn't exist).
+    """
+    try:
+        entries = os.scandir(_CLOUD_STORAGE)
+    except OSError:
+        return []
+    with entries:
+        return [entry.name for entry in entries]
+
+
+def _scan_cloud_storage(prefix: str, names: Optional[List[str]] = None) -> List[Path]:
+    """List ~/Library/CloudStorage entries whose names start with a prefix.
+
+    Args:
+        prefix: Folder name prefix such as 'OneDrive-'.
+        names: Entry names from _list_cloud_storage() to reuse; the folder
+            is read when omitted.
+
+    Returns:
+        Sorted list of matching paths (empty if the folder doesn't exist).
+    """
+    if names is None:
+        names = _list_cloud_storage()
+    return [_CLOUD_STORAGE / name for name in sorted(names) if name.startswith(prefix)]
+
+
+def _first_cloud_storage(prefix: str, names: Optional[List[str]] = None) -> Optional[Path]:
+    """Return the alphabetically first ~/Library/CloudStorage entry with a prefix.
+
+    Picks the minimum in a single pass rather than sorting every match.
+
+    Args:
+        prefix: Folder name prefix such as 'OneDrive-'.
+        names: Entry names from _list_cloud_storage() to reuse; the folder
+            is read when omitted.
+
+    Returns:
+        Path of the first matching entry, or None if there is none.
+    """
+    if names is None:
+        names = _list_cloud_storage()
+    first = min((name for name in names if name.startswith(prefix)), default=None)
+    return _CLOUD_STORAGE / first if first is not None else None
 
 
 def detect_onedrive() -> Optional[Path]:
@@ -30,14 +101,9 @@ def detect_onedrive() -> Optional[Path]:
     Returns:
         Path to OneDrive folder if found, None otherwise.
     """
-    cloud_storage = Path.home() / "Library/CloudStorage"
-    if cloud_storage.exists():
-        # Match OneDrive-* pattern (handles personal and business accounts)
-        matches = sorted(cloud_storage.glob("OneDrive-*"))
-        if matches:
-            # Return first match (most common case is single account)
-            return matches[0]
-    return None
+    # Match OneDrive-* pattern (handles personal and business accounts);
+    # return first match (most common case is single account)
+    return _first_cloud_storage("OneDrive-")
 
 
 def detect_all_onedrive() -> List[Path]:
@@ -46,22 +112,22 @@ def detect_all_onedrive() -> List[Path]:
     Returns:
         List of all OneDrive folder paths found.
     """
-    cloud_storage = Path.home() / "Library/CloudStorage"
-    if cloud_storage.exists():
-        return sorted(cloud_storage.glob("OneDrive-*"))
-    return []
+    return _scan_cloud_storage("OneDrive-")
 
 
 def detect_icloud() -> Optional[Path]:
     """Detect iCloud Drive location.
 
-    iCloud Drive is always at a fixed path on macOS.
+    iCloud Drive is always at a fixed path on macOS, so whether it exists
+    is checked once and cached for the life of the process.
 
     Returns:
         Path to iCloud Drive if it exists, None otherwise.
     """
-    icloud_path = Path.home() / "Library/Mobile Documents/com~apple~CloudDocs"
-    return icloud_path if icloud_path.exists() else None
+    global _icloud_exists
+    if _icloud_exists is None:
+        _icloud_exists = os.path.isdir(_ICLOUD_PATH)
+    return _ICLOUD_PATH if _icloud_exists else None
 
 
 def detect_dropbox() -> Optional[Path]:
@@ -76,13 +142,18 @@ def detect_dropbox() -> Optional[Path]:
         Path to Dropbox folder if found, None otherwise.
     """
     # Try to read from Dropbox config file
-    host_db = Path.home() / ".dropbox/host.db"
+    host_db = _HOME / ".dropbox/host.db"
     if host_db.exists():
         try:
-            lines = host_db.read_text().strip().split('\n')
-            if len(lines) >= 2:
-                # Second line is base64-encoded path
-                decoded_path = base64.b64decode(lines[1]).decode('utf-8')
+            data = host_db.read_bytes().strip()
+            first_newline = data.find(b'\n')
+            if first_newline >= 0:
+                # Second line is base64-encoded path; slice it out of the
+                # raw bytes rather than decoding and splitting the whole file
+                second_newline = data.find(b'\n', first_newline + 1)
+                end = second_newline if second_newline >= 0 else len(data)
+                encoded_path = memoryview(data)[first_newline + 1:end]
+                decoded_path = base64.b64decode(encoded_path).decode('utf-8')
                 dropbox_path = Path(decoded_path)
                 if dropbox_path.exists():
                     return dropbox_path
@@ -92,8 +163,8 @@ def detect_dropbox() -> Optional[Path]:
 
     # Fallback to common locations
     fallback_locations = [
-        Path.home() / "Dropbox",
-        Path.home() / "Library/CloudStorage/Dropbox",
+        _HOME / "Dropbox",
+        _CLOUD_STORAGE / "Dropbox",
     ]
 
     for fallback in fallback_locations:
@@ -113,12 +184,7 @@ def detect_google_drive() -> Optional[Path]:
     Returns:
         Path to Google Drive folder if found, None otherwise.
     """
-    cloud_storage = Path.home() / "Library/CloudStorage"
-    if cloud_storage.exists():
-        matches = sorted(cloud_storage.glob("GoogleDrive-*"))
-        if matches:
-            return matches[0]
-    return None
+    return _first_cloud_storage("GoogleDrive-")
 
 
 def detect_all_google_drive() -> List[Path]:
@@ -127,10 +193,7 @@ def detect_all_google_drive() -> List[Path]:
     Returns:
         List of all Google Drive folder paths found.
     """
-    cloud_storage = Path.home() / "Library/CloudStorage"
-    if cloud_storage.exists():
-        return sorted(cloud_storage.glob("GoogleDrive-*"))
-    return []
+    return _scan_cloud_storage("GoogleDrive-")
 
 
 def detect_all_cloud_storage() -> Dict[str, Path]:
@@ -150,25 +213,30 @@ def detect_all_cloud_storage() -> Dict[str, Path]:
     """
     detected: Dict[str, Path] = {}
 
-    detectors = [
-        ('OneDrive', detect_onedrive),
-        ('iCloud', detect_icloud),
-        ('Dropbox', detect_dropbox),
-        ('Google Drive', detect_google_drive),
+    # Read ~/Library/CloudStorage once and classify its entries by prefix
+    # rather than having each detector list it again
+    names = _list_cloud_storage()
+    candidates = [
+        ('OneDrive', _first_cloud_storage("OneDrive-", names)),
+        ('iCloud', detect_icloud()),
+        ('Dropbox', detect_dropbox()),
+        ('Google Drive', _first_cloud_storage("GoogleDrive-", names)),
     ]
 
-    for name, detector in detectors:
-        path = detector()
+    for name, path in candidates:
         if path:
             detected[name] = path
 
     return detected
 
 
+@functools.lru_cache(maxsize=256)
 def get_cloud_storage_display_name(path: Path) -> str:
     """Get a human-readable display name for a cloud storage path.
 
     Extracts account info from folder names like 'OneDrive-CompanyName'.
+    Results are cached per path, since the same accounts are labelled
+    repeatedly during a scan.
 
     Args:
         path: Path to cloud storage folder.
@@ -11,7 +11,7 @@ Usage:
 import sys
 import os
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional, Set, TextIO, Tuple
 
 # Try to import yaml, provide helpful error if missing
 try:
@@ -24,6 +24,20 @@ VALID_INSTALL_METHODS = {
     'cask', 'formula', 'mas', 'dmg', 'system',
     'npm', 'pip', 'cargo', 'unknown'
 }
+_VALID_METHODS_LIST = ', '.join(sorted(VALID_INSTALL_METHODS))
+
+# Entry fields holding relative paths, and whether each is checked for
+# path traversal (all of them are checked for absolute paths)
+_PATH_FIELDS = (
+    ('configuration_files', True),
+    ('xdg_configuration_files', True),
+    ('exclude_files', False),
+)
+
+# The script never moves, so the plugin's own database location is
+# resolved once at import
+_SCRIPT_DIR = Path(__file__).parent.resolve()
+_PLUGIN_HINTS_PATH = (_SCRIPT_DIR.parent.parent.parent / 'data' / 'app-hints.yaml').resolve()
 
 
 def validate_entry(name: str, config: dict) -> List[str]:
@@ -38,7 +52,7 @@ def validate_entry(name: str, config: dict) -> List[str]:
     method = config.get('install_method', '')
     if method not in VALID_INSTALL_METHODS:
         errors.append(f"{name}: Invalid install_method '{method}'. "
-                      f"Valid: {', '.join(sorted(VALID_INSTALL_METHODS))}")
+                      f"Valid: {_VALID_METHODS_LIST}")
 
     # Check at least one config location
     has_configs = (
@@ -48,24 +62,13 @@ def validate_entry(name: str, config: dict) -> List[str]:
     if not has_configs:
         errors.append(f"{name}: Must have configuration_files or xdg_configuration_files")
 
-    # Validate configuration_files paths
-    for path in config.get('configuration_files', []):
-        if path.startswith('/'):
-            errors.append(f"{name}: Absolute path not allowed in configuration_files: {path}")
-        if '..' in path:
-            errors.append(f"{name}: Path traversal (..) not allowed: {path}")
-
-    # Validate xdg_configuration_files paths
-    for path in config.get('xdg_configuration_files', []):
-        if path.startswith('/'):
-            errors.append(f"{name}: Absolute path not allowed in xdg_configuration_files: {path}")
-        if '..' in path:
-            errors.append(f"{name}: Path traversal (..) not allowed: {path}")
-
-    # Validate exclude_files if present
-    for path in config.get('exclude_files', []):
-        if path.startswith('/'):
-            errors.append(f"{name}: Absolute path not allowed in exclude_files: {path}")
+    # Validate paths
+    for field, check_traversal in _PATH_FIELDS:
+        for path in config.get(field, ()):
+            if path.startswith('/'):
+                errors.append(f"{name}: Absolute path not allowed in {field}: {path}")
+            if check_traversal and path.find('..') >= 0:
+                errors.append(f"{name}: Path traversal (..) not allowed: {path}")
 
     # Validate extensions_cmd if present (should be a string)
     extensions_cmd = config.get('extensions_cmd')
@@ -80,58 +83,147 @@ def validate_entry(name: str, config: dict) -> List[str]:
     return errors
 
 
-def check_paths_exist(name: str, config: dict) -> List[str]:
-    """Check if configuration paths actually exist on this system."""
+# Directory listings keyed by directory path: entry name -> is symlink, plus
+# the casefolded names for case-insensitive filesystems
+DirectoryCache = Dict[str, Tuple[Dict[str, bool], Set[str]]]
+
+
+def _path_exists(base: str, path: str, cache: DirectoryCache) -> bool:
+    """Check whether base/path exists using cached listings of its parent directory.
+
+    Each parent is read once with os.scandir, so checking many paths in the
+    same directory costs one readdir instead of one stat per path. Symlinks
+    (whose targets must be checked), names that only match ignoring case,
+    and '.'/'..' components fall back to a real exists() check.
+
+    Works on plain strings; like Path, an absolute path replaces base and
+    trailing slashes are ignored.
+    """
+    full_path = os.path.join(base, path).rstrip(os.sep) or os.sep
+    directory, entry_name = os.path.split(full_path)
+    if entry_name in ('', '.', '..'):
+        return os.path.exists(full_path)
+
+    listing = cache.get(directory)
+    if listing is None:
+        try:
+            with os.scandir(directory) as entries:
+                names = {entry.name: entry.is_symlink() for entry in entries}
+        except OSError:
+            names = {}
+        listing = cache[directory] = (names, {entry.casefold() for entry in names})
+
+    names, folded = listing
+    is_symlink = names.get(entry_name)
+    if is_symlink is False:
+        return True
+    if is_symlink or entry_name.casefold() in folded:
+        return os.path.exists(full_path)
+    return False
+
+
+def check_paths_exist(
+    name: str,
+    config: dict,
+    cache: Optional[DirectoryCache] = None
+) -> List[str]:
+    """Check if configuration paths actually exist on this system.
+
+    Pass the same cache across calls to share directory listings between entries.
+    """
     warnings = []
-    home = Path.home()
-    xdg_config = Path(os.environ.get('XDG_CONFIG_HOME', home / '.config'))
+    home = str(Path.home())
+    xdg_config = os.environ.get('XDG_CONFIG_HOME', os.path.join(home, '.config'))
+    if cache is None:
+        cache = {}
 
     # Check configuration_files (relative to $HOME)
     for path in config.get('configuration_files', []):
-        full_path = home / path
-        if not full_path.exists():
+        if not _path_exists(home, path, cache):
             warnings.append(f"{name}: Path not found (may be OK if app not installed): {path}")
 
     # Check xdg_configuration_files (relative to $XDG_CONFIG_HOME)
     for path in config.get('xdg_configuration_files', []):
-        full_path = xdg_config / path
-        if not full_path.exists():
+        if not _path_exists(xdg_config, path, cache):
             warnings.append(f"{name}: XDG path not found (may be OK if app not installed): {path}")
 
     return warnings
 
 
-def validate_yaml_structure(hints: dict) -> List[str]:
-    """Validate overall YAML structure."""
+def validate_entry_structure(name: Any, config: Any) -> List[str]:
+    """Validate the shape of a single app entry."""
     errors = []
 
-    if not isinstance(hints, dict):
-        errors.append("Root must be a dictionary of app entries")
-        return errors
-
-    for name, config in hints.items():
-        if not isinstance(name, str):
-            errors.append(f"App name must be a string, got: {type(name)}")
-        if not isinstance(config, dict):
-            errors.append(f"{name}: App config must be a dictionary, got: {type(config)}")
+    if not isinstance(name, str):
+        errors.append(f"App name must be a string, got: {type(name)}")
+    if not isinstance(config, dict):
+        errors.append(f"{name}: App config must be a dictionary, got: {type(config)}")
 
     return errors
 
 
-def find_hints_database() -> Path:
-    """Find the hints database relative to script location."""
-    script_dir = Path(__file__).parent.resolve()
+def _expect_stream_end(loader: yaml.SafeLoader, document_mark: Any) -> None:
+    """Consume the end of the current document and require the stream to end."""
+    loader.get_event()  # DocumentEndEvent
+    if not loader.check_event(yaml.StreamEndEvent):
+        event = loader.get_event()
+        raise yaml.composer.ComposerError(
+            "expected a single document in the stream", document_mark,
+            "but found another document", event.start_mark)
+
+
+def iter_hints(stream: TextIO) -> Iterator[Tuple[Any, Any]]:
+    """Yield (name, config) pairs from the hints YAML one entry at a time.
 
-    # Try different relative paths
-    possible_paths = [
-        script_dir.parent.parent.parent / 'data' / 'app-hints.yaml',
-        script_dir / '..' / '..' / '..' / 'data' / 'app-hints.yaml',
-    ]
+    Drives PyYAML's composer node by node through the root mapping, so only
+    the entry being validated is ever built as Python objects. A repeated
+    key is yielded again; as with yaml.safe_load, the later entry wins.
+    The rest of the stream is still read once the mapping ends, so a
+    second document or trailing invalid YAML is rejected like safe_load
+    does.
 
-    for path in possible_paths:
-        resolved = path.resolve()
-        if resolved.exists():
-            return resolved
+    Raises:
+        ValueError: If the document's root is not a mapping
+        yaml.YAMLError: If the YAML is invalid
+    """
+    loader = yaml.SafeLoader(stream)
+    try:
+        loader.get_event()  # StreamStartEvent
+        if loader.check_event(yaml.StreamEndEvent):
+            raise ValueError("Root must be a dictionary of app entries")
+        loader.get_event()  # DocumentStartEvent
+        if not loader.check_event(yaml.MappingStartEvent):
+            # Parse the rest anyway so invalid YAML is reported as such
+            root = loader.compose_node(None, None)
+            _expect_stream_end(loader, root.start_mark)
+            raise ValueError("Root must be a dictionary of app entries")
+        mapping_start = loader.get_event()
+
+        while not loader.check_event(yaml.MappingEndEvent):
+            key_node = loader.compose_node(None, None)
+            value_node = loader.compose_node(None, key_node)
+            name = loader.construct_object(key_node, deep=True)
+            try:
+                hash(name)
+            except TypeError:
+                raise yaml.constructor.ConstructorError(
+                    "while constructing a mapping", mapping_start.start_mark,
+                    "found unhashable key", key_node.start_mark)
+            config = loader.construct_object(value_node, deep=True)
+            # Drop constructed objects so finished entries can be freed
+            loader.constructed_objects.clear()
+            yield name, config
+
+        loader.get_event()  # MappingEndEvent
+        _expect_stream_end(loader, mapping_start.start_mark)
+    finally:
+        loader.dispose()
+
+
+def find_hints_database() -> Path:
+    """Find the hints database relative to script location."""
+    if _PLUGIN_HINTS_PATH.exists():
+        return _PLUGIN_HINTS_PATH
 
     # Also check if running from plugin root
     cwd = Path.cwd()
@@ -143,32 +235,37 @@ def find_hints_database() -> Path:
     if macinventory_path.exists():
         return macinventory_path
 
-    return possible_paths[0].resolve()
+    return _PLUGIN_HINTS_PATH
 
 
 def print_summary(errors: List[str], warnings: List[str], total: int, verbose: bool):
-    """Print validation summary."""
+    """Print validation summary.
+
+    The report is assembled first and written with a single writelines(),
+    since it can run to one line per entry.
+    """
+    lines = []
     if errors:
-        print("\n" + "=" * 60)
-        print("ERRORS:")
-        print("=" * 60)
-        for error in errors:
-            print(f"  ✗ {error}")
+        lines.append("\n" + "=" * 60)
+        lines.append("ERRORS:")
+        lines.append("=" * 60)
+        lines.extend(f"  ✗ {error}" for error in errors)
 
     if warnings and verbose:
-        print("\n" + "-" * 60)
-        print("WARNINGS (paths not found on this system):")
-        print("-" * 60)
-        for warning in warnings:
-            print(f"  ⚠ {warning}")
+        lines.append("\n" + "-" * 60)
+        lines.append("WARNINGS (paths not found on this system):")
+        lines.append("-" * 60)
+        lines.extend(f"  ⚠ {warning}" for warning in warnings)
 
-    print("\n" + "=" * 60)
+    lines.append("\n" + "=" * 60)
     if not errors:
-        print(f"✓ Validated {total} entries successfully")
+        lines.append(f"✓ Validated {total} entries successfully")
         if warnings:
-            print(f"  ({len(warnings)} path warnings - apps may not be installed)")
+            lines.append(f"  ({len(warnings)} path warnings - apps may not be installed)")
     else:
-        print(f"✗ Found {len(errors)} error(s) in {total} entries")
+        lines.append(f"✗ Found {len(errors)} error(s) in {total} entries")
+
+    sys.stdout.writelines(f"{line}\n" for line in lines)
 
 
 def main():
@@ -197,45 +294,56 @@ def main():
     if verbose:
         print(f"Loading hints from: {hints_path}")
 
-    # Load and parse YAML
+    # Results per app name as (structure errors, errors, warnings); like
+    # yaml.safe_load, a repeated name replaces the earlier entry in place
+    results: Dict[Any, Tuple[List[str], List[str], List[str]]] = {}
+    structure_errors = []
+    directory_cache: DirectoryCache = {}
+
+    # Parse and validate the YAML one entry at a time
     try:
         with open(hints_path) as f:
-            hints = yaml.safe_load(f)
+            for name, config in iter_hints(f):
+                entry_structure_errors = validate_entry_structure(name, config)
+                errors: List[str] = []
+                warnings: List[str] = []
+
+                # Filter to specific app if provided
+                if not entry_structure_errors and (not app_filter or name == app_filter):
+                    errors = validate_entry(name, config)
+                    if check_paths:
+                        warnings = check_paths_exist(name, config, directory_cache)
+
+                results[name] = (entry_structure_errors, errors, warnings)
     except yaml.YAMLError as e:
         print(f"Error: Invalid YAML syntax in {hints_path}")
         print(f"  {e}")
         sys.exit(1)
+    except ValueError as e:
+        structure_errors.append(str(e))
 
-    # Validate YAML structure
-    structure_errors = validate_yaml_structure(hints)
+    # Report YAML structure problems instead of validation results
+    for entry_structure_errors, _, _ in results.values():
+        structure_errors.extend(entry_structure_errors)
     if structure_errors:
         print("YAML Structure Errors:")
         for error in structure_errors:
             print(f"  ✗ {error}")
         sys.exit(1)
 
-    # Filter to specific app if provided
     if app_filter:
-        if app_filter not in hints:
+        if app_filter not in results:
             print(f"Error: App '{app_filter}' not found in hints database")
-            print(f"\nAvailable apps: {', '.join(sorted(hints.keys()))}")
+            print(f"\nAvailable apps: {', '.join(sorted(results))}")
             sys.exit(1)
-        hints = {app_filter: hints[app_filter]}
-
-    all_errors = []
-    all_warnings = []
-
-    # Validate each entry
-    for name, config in hints.items():
-        errors = validate_entry(name, config)
-        all_errors.extend(errors)
+        results = {app_filter: results[app_filter]}
 
-        if check_paths:
-            warnings = check_paths_exist(name, config)
-            all_warnings.extend(warnings)
+    all_errors = [error for _, errors, _ in results.values() for error in errors]
+    all_warnings = [warning for _, _, warnings in results.values() for warning in warnings]
+    total = len(results)
 
     # Print results
-    print_summary(all_errors, all_warnings, len(hints), verbose)
+    print_summary(all_errors, all_warnings, total, verbose)
 
     # Exit with appropriate code
     sys.exit(1 if all_errors else 0)